@@ -6,6 +6,7 @@ import json
 import random
 from datetime import datetime
 from database import DatabaseManager
+from utils.goat_roster import invalidate_active_goats_cache
 
 logger = logging.getLogger(__name__)
 
@@ -98,34 +99,24 @@ class AIEngine:
         """
         Neural Re-Identification with Similarity Scoring.
         Compares against the database using a tiered similarity threshold.
+        All stored signatures are scored in one matrix-vector product.
         """
         if not new_signature: return None
         
-        known_signatures = db.execute_query("SELECT goat_id, color_signature FROM goat_visual_signatures")
-        if not known_signatures: return None
-        
         import numpy as np
-        best_match_id = None
-        max_similarity = 0.92 # Threshold for high-accuracy matching
+        new_sig_np = np.asarray(new_signature, dtype=np.float32)
         
-        new_sig_np = np.array(new_signature)
+        goat_ids, stored = db.get_all_signatures(len(new_sig_np))
+        if len(goat_ids) == 0: return None
         
-        for record in known_signatures:
-            try:
-                stored_sig = json.loads(record['color_signature'])
-                stored_sig_np = np.array(stored_sig)
-                
-                if len(new_sig_np) != len(stored_sig_np): continue
-                
-                # Cosine Similarity
-                similarity = np.dot(new_sig_np, stored_sig_np) / (np.linalg.norm(new_sig_np) * np.linalg.norm(stored_sig_np) + 1e-8)
-                
-                if similarity > max_similarity:
-                    max_similarity = similarity
-                    best_match_id = record['goat_id']
-            except: continue
-                
-        return best_match_id
+        # Cosine Similarity against every stored signature at once
+        norms = np.linalg.norm(stored, axis=1) * np.linalg.norm(new_sig_np) + 1e-8
+        similarity = (stored @ new_sig_np) / norms
+        
+        best = int(np.argmax(similarity))
+        if similarity[best] > 0.92: # Threshold for high-accuracy matching
+            return int(goat_ids[best])
+        return None
 
     def _process_video(self, video_id, file_path, scenario):
         """
@@ -152,11 +143,12 @@ class AIEngine:
             active_tracks = {} # track_id -> {"goat_id": id, "bbox": (x,y,w,h), "frames_unseen": 0}
             
             while cap.isOpened():
-                ret, frame = cap.read()
-                if not ret: break
+                if not cap.grab(): break # demux only; decode just the sampled frames
                 
                 frame_count += 1
                 if frame_count % 5 != 0: continue # Higher frequency for better tracking continuity
+                ret, frame = cap.retrieve()
+                if not ret: break
 
                 results = self.model(frame, verbose=False, conf=0.45)
                 
@@ -209,8 +201,9 @@ class AIEngine:
                         )
                         db.execute_update(
                             "INSERT INTO goat_visual_signatures (goat_id, color_signature) VALUES (?, ?)",
-                            (goat_id, json.dumps(signature))
+                            (goat_id, np.asarray(signature, dtype=np.float32).tobytes())
                         )
+                        invalidate_active_goats_cache(db.db_path)
                         logger.info(f"New specimen registered: {tag} (ID: {goat_id})")
                     
                     # Create new session track
@@ -12,6 +12,7 @@ import os
 from dotenv import load_dotenv
 from datetime import datetime
 from config import config
+from utils.response import OrjsonProvider
 
 load_dotenv()
 
@@ -56,6 +57,8 @@ logger = logging.getLogger(__name__)
 
 # Initialize Flask app
 app = Flask(__name__)
+if OrjsonProvider is not None:
+    app.json = OrjsonProvider(app)
 CORS(app, resources={r"/api/*": {"origins": "*"}})
 
 # Initialize database
@@ -30,6 +30,7 @@ import os
 import math
 from datetime import datetime
 from collections import deque, Counter
+from utils.goat_roster import invalidate_active_goats_cache
 
 # Configure Enterprise Logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - [BIO-ENGINE] - %(levelname)s - %(message)s')
@@ -250,12 +251,15 @@ class BioEngine:
 
         try:
             while cap.isOpened():
-                ret, frame = cap.read()
-                if not ret:
+                # grab() only demuxes; skipped frames are never decoded
+                if not cap.grab():
                     break
                     
                 frame_count += 1
                 if frame_count % 5 != 0: continue 
+                ret, frame = cap.retrieve()
+                if not ret:
+                    break
                 
                 # 1. Detect (HAL Interface)
                 detections = self._acquire_region_proposals(frame)
@@ -376,7 +380,8 @@ class BioEngine:
             """, (new_id, vector_blob))
             
             conn.commit()
-            return new_id
+        invalidate_active_goats_cache(self.db_path)
+        return new_id
 
     def _update_goat_history(self, goat_id, vector, video_id):
         """
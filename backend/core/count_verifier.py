@@ -81,11 +81,36 @@ class CountVerifier:
         Returns:
             CountVerificationResult with honest assessment
         """
-        if not counts_by_frame:
-            return self._create_failure_result("No detections found")
+        return self.verify_count_arrays(
+            np.fromiter(counts_by_frame.keys(), dtype=np.int64, count=len(counts_by_frame)),
+            np.fromiter(counts_by_frame.values(), dtype=np.float64, count=len(counts_by_frame)),
+            np.fromiter(uncertainty_by_frame.values(), dtype=np.float64, count=len(uncertainty_by_frame)),
+            video_metadata
+        )
+    
+    def verify_count_arrays(self,
+                            frames: np.ndarray,
+                            counts: np.ndarray,
+                            uncertainty: np.ndarray,
+                            video_metadata: Optional[Dict] = None) -> CountVerificationResult:
+        """
+        Array form of verify_counts: parallel per-frame arrays instead of dicts.
+        
+        Args:
+            frames: frame numbers, int[N]
+            counts: detected count per frame, aligned with `frames`
+            uncertainty: uncertainty scores (0-100)
+            video_metadata: Optional metadata (resolution, fps, etc.)
+            
+        Returns:
+            CountVerificationResult with honest assessment
+        """
+        frames = np.asarray(frames)
+        counts = np.asarray(counts, dtype=np.float64)
+        uncertainties = np.asarray(uncertainty, dtype=np.float64)
         
-        counts = list(counts_by_frame.values())
-        uncertainties = list(uncertainty_by_frame.values())
+        if counts.size == 0:
+            return self._create_failure_result("No detections found")
         
         warnings = []
         failure_reasons = []
@@ -124,7 +149,7 @@ class CountVerifier:
             warnings.append("Very low count - verify video contains goats")
         
         # Sudden jumps (more than 50% change frame-to-frame)
-        sudden_jumps = self._detect_sudden_jumps(counts_by_frame)
+        sudden_jumps = self._detect_sudden_jumps(frames, counts)
         if sudden_jumps > len(counts) * 0.1:
             warnings.append(f"Detected {sudden_jumps} sudden count changes - possible tracking errors")
         
@@ -133,7 +158,7 @@ class CountVerifier:
             cv=cv,
             temporal_stability=temporal_stability,
             avg_uncertainty=avg_uncertainty,
-            outlier_ratio=len(outliers) / len(counts) if counts else 0
+            outlier_ratio=len(outliers) / len(counts)
         )
         
         # 8. DETERMINE COUNT RANGE (SEV-0 Rule 2: Ground-truth alignment)
@@ -201,7 +226,14 @@ class CountVerifier:
         
         return result
     
-    def _calculate_temporal_stability(self, counts: List[int]) -> float:
+    @staticmethod
+    def _relative_changes(counts: np.ndarray) -> np.ndarray:
+        """|c[i] - c[i-1]| / c[i-1] for every step whose previous count is > 0"""
+        prev, curr = counts[:-1], counts[1:]
+        mask = prev > 0
+        return np.abs(curr[mask] - prev[mask]) / prev[mask]
+    
+    def _calculate_temporal_stability(self, counts: np.ndarray) -> float:
         """
         Calculate how stable counts are across frames.
         Returns 0-100, where 100 = perfectly stable.
@@ -210,13 +242,9 @@ class CountVerifier:
             return 0.0
         
         # Calculate frame-to-frame changes
-        changes = []
-        for i in range(1, len(counts)):
-            if counts[i-1] > 0:
-                change_pct = abs(counts[i] - counts[i-1]) / counts[i-1]
-                changes.append(change_pct)
+        changes = self._relative_changes(counts)
         
-        if not changes:
+        if changes.size == 0:
             return 0.0
         
         # Stability = inverse of average change
@@ -225,10 +253,10 @@ class CountVerifier:
         
         return stability
     
-    def _detect_outliers(self, counts: List[int]) -> List[int]:
+    def _detect_outliers(self, counts: np.ndarray) -> np.ndarray:
         """Detect statistical outliers using IQR method"""
         if len(counts) < 4:
-            return []
+            return counts[:0]
         
         q1 = np.percentile(counts, 25)
         q3 = np.percentile(counts, 75)
@@ -237,24 +265,12 @@ class CountVerifier:
         lower_bound = q1 - 1.5 * iqr
         upper_bound = q3 + 1.5 * iqr
         
-        outliers = [c for c in counts if c < lower_bound or c > upper_bound]
-        return outliers
+        return counts[(counts < lower_bound) | (counts > upper_bound)]
     
-    def _detect_sudden_jumps(self, counts_by_frame: Dict[int, int]) -> int:
+    def _detect_sudden_jumps(self, frames: np.ndarray, counts: np.ndarray) -> int:
         """Count number of sudden jumps (>50% change frame-to-frame)"""
-        sorted_frames = sorted(counts_by_frame.keys())
-        jumps = 0
-        
-        for i in range(1, len(sorted_frames)):
-            prev_count = counts_by_frame[sorted_frames[i-1]]
-            curr_count = counts_by_frame[sorted_frames[i]]
-            
-            if prev_count > 0:
-                change_pct = abs(curr_count - prev_count) / prev_count
-                if change_pct > 0.5:  # 50% change
-                    jumps += 1
-        
-        return jumps
+        ordered = counts[np.argsort(frames, kind='stable')]
+        return int(np.count_nonzero(self._relative_changes(ordered) > 0.5))  # 50% change
     
     def _calculate_confidence(self, 
                              cv: float,
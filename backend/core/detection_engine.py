@@ -309,8 +309,8 @@ class DetectionEngine:
         
         try:
             while cap.isOpened():
-                ret, frame = cap.read()
-                if not ret:
+                # grab() only demuxes; skipped frames are never decoded
+                if not cap.grab():
                     break
                 
                 frame_number += 1
@@ -319,6 +319,10 @@ class DetectionEngine:
                 if frame_number % frame_skip != 0:
                     continue
                 
+                ret, frame = cap.retrieve()
+                if not ret:
+                    break
+                
                 # Detect objects
                 detections = self.detect_frame(frame, frame_number)
                 
@@ -15,6 +15,7 @@ import time
 import json
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
+from utils.goat_roster import invalidate_active_goats_cache
 
 from core.herd_scale_detector import (
     HerdScaleDetector,
@@ -140,14 +141,17 @@ class HerdScaleVideoProcessor:
         # 4. SEV-0 COUNT VERIFICATION (Rule 2: Ground-Truth Alignment)
         logger.info(f"Video {video_id}: Running SEV-0 count verification...")
         
-        # Prepare data for verification
-        counts_by_frame = {fn: len(dets) for fn, dets in detections_by_frame.items()}
-        uncertainty_by_frame = {fn: unc for fn, unc in zip(detections_by_frame.keys(), uncertainty_scores)}
+        # Prepare data for verification (parallel per-frame arrays)
+        n_frames = len(detections_by_frame)
+        frames = np.fromiter(detections_by_frame.keys(), dtype=np.int64, count=n_frames)
+        counts = np.fromiter((len(dets) for dets in detections_by_frame.values()), dtype=np.int64, count=n_frames)
+        uncertainty = np.asarray(uncertainty_scores[:n_frames], dtype=np.float64)
         
         # Run verification
-        verification_result = self.count_verifier.verify_counts(
-            counts_by_frame=counts_by_frame,
-            uncertainty_by_frame=uncertainty_by_frame,
+        verification_result = self.count_verifier.verify_count_arrays(
+            frames=frames,
+            counts=counts,
+            uncertainty=uncertainty,
             video_metadata={
                 'resolution': (cap.get(cv2.CAP_PROP_FRAME_WIDTH), cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
                 'fps': fps,
@@ -170,8 +174,7 @@ class HerdScaleVideoProcessor:
             logger.warning(f"  Failure Reasons: {', '.join(verification_result.failure_reasons)}")
         
         # 5. GENERATE EXPERT ANALYSIS (SEV-0 Rule 5: Human-verifiable proof)
-        counts = list(counts_by_frame.values())
-        max_obs = max(counts) if counts else 0
+        max_obs = int(counts.max()) if n_frames else 0
         avg_uncertainty = np.mean(uncertainty_scores) if uncertainty_scores else 0
         
         scene_analysis = SceneDensityAnalysis(
@@ -212,7 +215,7 @@ class HerdScaleVideoProcessor:
             "SCENE ANALYSIS:",
             f"  Density Level: {scene_analysis.density_level.upper()}",
             f"  Occlusion Severity: {avg_uncertainty:.1f}%",
-            f"  Frames Analyzed: {len(counts_by_frame)}",
+            f"  Frames Analyzed: {n_frames}",
             f"  Unique Goats Tracked: {len(unique_goats_seen)}",
             ""
         ]
@@ -360,8 +363,9 @@ class HerdScaleVideoProcessor:
                 cursor = conn.execute("INSERT INTO goats (ear_tag, status, first_seen) VALUES (?, 'Active', CURRENT_TIMESTAMP)", (ear_tag,))
                 gid = cursor.lastrowid
                 conn.execute("INSERT INTO biometric_registry (goat_id, embedding_blob) VALUES (?, ?)", (gid, embedding.tobytes()))
-                return gid
         except: return None
+        invalidate_active_goats_cache(self.db_path)
+        return gid
 
     def _save_goat_profile_image(self, video_id, goat_id, frame, bbox):
         try:
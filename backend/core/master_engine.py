@@ -33,6 +33,7 @@ import os
 import json
 import threading
 from config import config
+from utils.goat_roster import invalidate_active_goats_cache
 from typing import Dict, List, Tuple, Optional, Any
 from datetime import datetime
 from dataclasses import dataclass, asdict
@@ -267,8 +268,8 @@ class MasterEngine:
             prev_frame = None
             
             while cap.isOpened():
-                ret, frame = cap.read()
-                if not ret:
+                # grab() only demuxes; skipped frames are never decoded
+                if not cap.grab():
                     break
                 
                 frame_number += 1
@@ -277,6 +278,10 @@ class MasterEngine:
                 if frame_number % frame_skip != 0:
                     continue
                 
+                ret, frame = cap.retrieve()
+                if not ret:
+                    break
+                
                 # 4. Detect objects in frame
                 detections = self.detection_engine.detect_frame(frame, frame_number)
                 
@@ -657,11 +662,12 @@ class MasterEngine:
                 
                 conn.commit()
                 
-                return goat_id
-                
         except Exception as e:
             logger.error(f"Failed to register new goat: {e}")
             raise
+        
+        invalidate_active_goats_cache(self.db_path)
+        return goat_id
     
     def _update_goat_sighting(self, goat_id: int, video_id: int):
         """Update goat's last seen timestamp and create sighting event"""
@@ -2,9 +2,13 @@ import sqlite3
 import os
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Iterable
 import random
+import json
+from contextlib import contextmanager
+import numpy as np
 from utils.formulas import calculate_mass, calculate_meat_yield
+from utils.sqlite_conn import apply_pragmas
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -31,19 +35,22 @@ class DatabaseManager:
     Handles all database operations with proper error handling and connection pooling.
     """
     
+    # Database files whose schema has already been created in this process.
+    _initialized: set = set()
+    
     def __init__(self, db_path: str = DB_PATH):
         self.db_path = db_path
         self._connection = None
+        self._in_transaction = False
         logger.info(f"DatabaseManager initialized with path: {self.db_path}")
     
     def _connect(self) -> sqlite3.Connection:
         """Create and return a database connection with proper configuration."""
         try:
-            conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30.0)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30.0, cached_statements=256)
             conn.row_factory = sqlite3.Row  # Enable dict-like access
             conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign keys
-            conn.execute("PRAGMA journal_mode = WAL")  # Enable Write-Ahead Logging
-            return conn
+            return apply_pragmas(conn)  # WAL + cache tuning shared with the maintenance scripts
         except sqlite3.Error as e:
             logger.error(f"Database connection error: {e}")
             raise
@@ -61,12 +68,39 @@ class DatabaseManager:
             self._connection = None
             logger.info("Database connection closed")
     
+    @contextmanager
+    def transaction(self):
+        """
+        Group writes into a single BEGIN IMMEDIATE ... COMMIT block.
+        execute_update/execute_many skip their per-statement commit inside it,
+        so the whole block costs one fsync. Rolls back on any exception.
+        """
+        conn = self.get_connection()
+        conn.execute("BEGIN IMMEDIATE")
+        self._in_transaction = True
+        try:
+            yield self
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._in_transaction = False
+    
     def initialize_database(self):
         """
         Initialize all database tables with proper schema.
         Creates tables for goats, videos, events, health records, feeding records, and reports.
+        Repeat calls for a file that was already initialized in this process are no-ops,
+        as long as its schema is still there (the file may have been deleted and recreated).
         """
+        key = os.path.abspath(self.db_path)
         conn = self.get_connection()
+        if key in DatabaseManager._initialized and conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'goats'"
+        ).fetchone():
+            return
+        
         cursor = conn.cursor()
         
         try:
@@ -157,6 +191,79 @@ class DatabaseManager:
                 )
             ''')
 
+            # Health status roll-up - maintained by triggers so summaries never scan health_records.
+            # One row per status, plus a '__all__' row that also counts NULL-status records so the
+            # report's average health score still covers every record.
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='health_status_counts'")
+            backfill_health_rollup = cursor.fetchone() is None
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS health_status_counts (
+                    status TEXT PRIMARY KEY,
+                    count INTEGER NOT NULL DEFAULT 0,
+                    sum_score REAL NOT NULL DEFAULT 0,
+                    n_score INTEGER NOT NULL DEFAULT 0
+                )
+            ''')
+            if backfill_health_rollup:
+                cursor.execute('''
+                    INSERT INTO health_status_counts (status, count, sum_score, n_score)
+                    SELECT status, COUNT(*), COALESCE(SUM(health_score), 0), COUNT(health_score)
+                    FROM health_records WHERE status IS NOT NULL GROUP BY status
+                ''')
+            cursor.execute("SELECT 1 FROM health_status_counts WHERE status = '__all__'")
+            if cursor.fetchone() is None:
+                cursor.execute('''
+                    INSERT INTO health_status_counts (status, count, sum_score, n_score)
+                    SELECT '__all__', COUNT(*), COALESCE(SUM(health_score), 0), COUNT(health_score)
+                    FROM health_records
+                ''')
+
+            # v1 triggers skipped NULL-status records entirely; replaced by the _v2 set below
+            for old_trigger in ('hr_rollup_ai', 'hr_rollup_ad', 'hr_rollup_au'):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {old_trigger}")
+
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS hr_rollup_ai_v2 AFTER INSERT ON health_records
+                BEGIN
+                    INSERT INTO health_status_counts (status, count, sum_score, n_score)
+                    SELECT s.status, 1, COALESCE(NEW.health_score, 0), NEW.health_score IS NOT NULL
+                    FROM (SELECT NEW.status AS status UNION ALL SELECT '__all__') AS s
+                    WHERE s.status IS NOT NULL
+                    ON CONFLICT(status) DO UPDATE SET
+                        count = count + 1,
+                        sum_score = sum_score + excluded.sum_score,
+                        n_score = n_score + excluded.n_score;
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS hr_rollup_ad_v2 AFTER DELETE ON health_records
+                BEGIN
+                    UPDATE health_status_counts SET
+                        count = count - 1,
+                        sum_score = sum_score - COALESCE(OLD.health_score, 0),
+                        n_score = n_score - (OLD.health_score IS NOT NULL)
+                    WHERE status IN (OLD.status, '__all__');
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS hr_rollup_au_v2 AFTER UPDATE OF status, health_score ON health_records
+                BEGIN
+                    UPDATE health_status_counts SET
+                        count = count - 1,
+                        sum_score = sum_score - COALESCE(OLD.health_score, 0),
+                        n_score = n_score - (OLD.health_score IS NOT NULL)
+                    WHERE status IN (OLD.status, '__all__');
+                    INSERT INTO health_status_counts (status, count, sum_score, n_score)
+                    SELECT s.status, 1, COALESCE(NEW.health_score, 0), NEW.health_score IS NOT NULL
+                    FROM (SELECT NEW.status AS status UNION ALL SELECT '__all__') AS s
+                    WHERE s.status IS NOT NULL
+                    ON CONFLICT(status) DO UPDATE SET
+                        count = count + 1,
+                        sum_score = sum_score + excluded.sum_score,
+                        n_score = n_score + excluded.n_score;
+                END
+            ''')
+
             # Settings table - System configuration
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS settings (
@@ -305,7 +412,7 @@ class DatabaseManager:
                     signature_id INTEGER PRIMARY KEY AUTOINCREMENT,
                     goat_id INTEGER,
                     embedding BLOB,  -- Vector representation of the goat
-                    color_signature TEXT, -- JSON histogram
+                    color_signature TEXT, -- float32 histogram bytes (BLOB; older rows: JSON list)
                     pattern_id TEXT,
                     last_updated DATETIME DEFAULT CURRENT_TIMESTAMP,
                     FOREIGN KEY (goat_id) REFERENCES goats(goat_id) ON DELETE CASCADE
@@ -387,6 +494,8 @@ class DatabaseManager:
                 logger.error(f"Failed to migrate events table: {e}")
 
             conn.commit()
+            if self.db_path != ':memory:':
+                DatabaseManager._initialized.add(key)
             logger.info("Database schema initialized successfully")
             
         except sqlite3.Error as e:
@@ -534,31 +643,76 @@ class DatabaseManager:
             logger.error(f"Query execution error: {e}")
             raise
     
+    def execute_query_fast(self, query: str, params: tuple = ()) -> Tuple[List[str], List[tuple]]:
+        """
+        Execute a SELECT query returning (column_names, plain tuple rows).
+        Skips sqlite3.Row construction for list endpoints that serialize straight to JSON.
+        """
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(query, params)
+            columns = [col[0] for col in cursor.description]
+            return columns, cursor.fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Query execution error: {e}")
+            raise
+    
     def execute_update(self, query: str, params: tuple = ()) -> int:
         """Execute an INSERT/UPDATE/DELETE query and return last inserted row ID."""
         try:
             conn = self.get_connection()
             cursor = conn.cursor()
             cursor.execute(query, params)
-            conn.commit()
+            if not self._in_transaction:
+                conn.commit()
             return cursor.lastrowid
         except sqlite3.Error as e:
             logger.error(f"Update execution error: {e}")
-            conn.rollback()
+            if not self._in_transaction:
+                conn.rollback()
             raise
     
-    def execute_many(self, query: str, params_list: List[tuple]) -> int:
+    def execute_many(self, query: str, params_list: Iterable[tuple]) -> int:
         """Execute multiple INSERT/UPDATE queries."""
         try:
             conn = self.get_connection()
             cursor = conn.cursor()
             cursor.executemany(query, params_list)
-            conn.commit()
+            if not self._in_transaction:
+                conn.commit()
             return cursor.rowcount
         except sqlite3.Error as e:
             logger.error(f"Batch execution error: {e}")
-            conn.rollback()
+            if not self._in_transaction:
+                conn.rollback()
             raise
+    
+    def get_all_signatures(self, dim: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Load every stored visual signature of length `dim` as one matrix.
+        Returns (goat_ids[N], signatures[N, dim] float32) for batched matching.
+        Signatures are float32 bytes; older rows holding a JSON list are decoded too.
+        """
+        _, rows = self.execute_query_fast("SELECT goat_id, color_signature FROM goat_visual_signatures")
+        ids, vectors = [], []
+        for goat_id, stored in rows:
+            if stored is None:
+                continue
+            try:
+                if isinstance(stored, bytes):
+                    vec = np.frombuffer(stored, dtype=np.float32)
+                else:
+                    vec = np.asarray(json.loads(stored), dtype=np.float32)
+            except (ValueError, TypeError):
+                continue
+            if vec.shape == (dim,):
+                ids.append(goat_id)
+                vectors.append(vec)
+        if not vectors:
+            return np.empty(0, dtype=np.int64), np.empty((0, dim), dtype=np.float32)
+        return np.asarray(ids, dtype=np.int64), np.stack(vectors)
 
 
 # Initialize database on module import
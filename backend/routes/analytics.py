@@ -1,7 +1,7 @@
 from flask import Blueprint, jsonify, request
 from database import DatabaseManager
 from utils.response import success_response, error_response
-from utils.formulas import calculate_mass, calculate_meat_yield
+from utils.formulas import calculate_mass_batch, calculate_meat_yield_batch
 import logging
 
 analytics_bp = Blueprint('analytics', __name__)
@@ -34,7 +34,8 @@ def get_mass_predictions():
         if not goats:
             return success_response([])
         
-        results = []
+        # Per-goat measurements; the formulas then run once over the whole herd
+        measured = []
         
         for goat in goats:
             goat_dict = dict(goat)
@@ -113,10 +114,6 @@ def get_mass_predictions():
             body_length_m = max(0.5, min(body_length_m, 1.4))
             body_height_m = max(0.4, min(body_height_m, 1.1))
             
-            # STEP 3: SCIENTIFIC MASS CALCULATION
-            # Formula: M = a * L^b * H^c (Sowande et al.)
-            mass_kg = calculate_mass(breed, body_length_m, body_height_m)
-            
             # STEP 4: BCS ADJUSTMENT
             health = bbox_data.get('health_score', 75)
             if health >= 85: bcs = 4
@@ -124,15 +121,30 @@ def get_mass_predictions():
             elif health >= 55: bcs = 2
             else: bcs = 1
             
-            # STEP 5: ACTIVITY FACTOR
-            # (Simplified for now to avoid complex history query in this MVP, 
-            # or could add back if needed)
-            activity_factor = 1.0 
-            
-            final_mass_kg = mass_kg * activity_factor
-            
-            # STEP 6: YIELD
-            yield_data = calculate_meat_yield(final_mass_kg, bcs, breed)
+            measured.append((goat_dict, bbox_data, breed, body_length_m, body_height_m, bcs, health))
+        
+        breeds = [m[2] for m in measured]
+        
+        # STEP 3: SCIENTIFIC MASS CALCULATION
+        # Formula: M = a * L^b * H^c (Sowande et al.)
+        mass_kg = calculate_mass_batch(breeds, [m[3] for m in measured], [m[4] for m in measured])
+        
+        # STEP 5: ACTIVITY FACTOR
+        # (Simplified for now to avoid complex history query in this MVP, 
+        # or could add back if needed)
+        activity_factor = 1.0 
+        
+        final_mass = mass_kg * activity_factor
+        
+        # STEP 6: YIELD
+        yields = calculate_meat_yield_batch(final_mass, [m[5] for m in measured], breeds)
+        yields = {k: v.tolist() for k, v in yields.items()}
+        
+        results = []
+        
+        for i, (goat_dict, bbox_data, breed, body_length_m, body_height_m, bcs, health) in enumerate(measured):
+            final_mass_kg = final_mass[i].item()
+            yield_data = {k: v[i] for k, v in yields.items()}
             
             # STEP 7: STATUS
             if final_mass_kg > 50 and health > 75: status = 'Ready for Harvest'
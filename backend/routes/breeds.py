@@ -1,10 +1,17 @@
-from flask import Blueprint, jsonify
-from utils.response import success_response
+from flask import Blueprint, jsonify, request
+from utils.response import success_response, raw_success_response, to_json
 
 breeds_bp = Blueprint('breeds', __name__)
 
-from utils.breed_data import BREED_DATABASE
+from utils.breed_data import BREED_DATABASE, breeds_in_category
+
+# The registry is immutable, so the full listing is serialized once at import.
+# Entries are read-only mappings; dict() them for the JSON encoder.
+_ALL_BREEDS_JSON = to_json({"breeds": [dict(b) for b in BREED_DATABASE]})
 
 @breeds_bp.route('/breeds', methods=['GET'])
 def get_breeds():
-    return success_response({"breeds": BREED_DATABASE})
+    category = request.args.get('category')
+    if category:
+        return success_response({"breeds": [dict(b) for b in breeds_in_category(category)]})
+    return raw_success_response(_ALL_BREEDS_JSON)
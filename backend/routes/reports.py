@@ -1,16 +1,42 @@
 from flask import Blueprint, jsonify, request, Response, make_response
 from database import DatabaseManager
-from utils.response import success_response, error_response
+from utils.response import success_response, raw_success_response, error_response, to_json
 import logging
 import json
 from datetime import datetime
 import csv
 import io
+import functools
 
 reports_bp = Blueprint('reports', __name__)
 logger = logging.getLogger(__name__)
 db = DatabaseManager()
 
+def _csv_escape(value):
+    """Quote a single CSV field the same way csv.writer (QUOTE_MINIMAL) does."""
+    s = str(value)
+    if ',' in s or '"' in s or '\n' in s or '\r' in s:
+        return '"' + s.replace('"', '""') + '"'
+    return s
+
+@functools.lru_cache(maxsize=None)
+def _csv_emitter(report_type, keys):
+    """
+    Compile (once per report_type/schema) a generator that streams CSV lines
+    for a list of row dicts, so downloads skip the per-row csv.writer dispatch.
+    """
+    header = ','.join(_csv_escape(k) for k in keys) + '\r\n'
+    row_expr = '+","+'.join(f"_s(r.get({k!r}, ''))" for k in keys)
+    src = (
+        "def emit(rows):\n"
+        f"    yield {header!r}\n"
+        "    for r in rows:\n"
+        f"        yield {row_expr}+'\\r\\n'\n"
+    )
+    scope = {'_s': _csv_escape}
+    exec(src, scope)
+    return scope['emit']
+
 def generate_report_data(report_type, filters=None):
     """Generates actual data based on report type and filters"""
     data = {}
@@ -77,17 +103,18 @@ def generate_report_data(report_type, filters=None):
         data['records'] = [dict(e) for e in events]
 
     elif report_type == 'Health Summary':
-        # Get latest health stats
-        health_counts = db.execute_query("""
-            SELECT status, COUNT(*) as count 
-            FROM health_records 
-            GROUP BY status
+        # Read the trigger-maintained roll-up instead of scanning health_records
+        rollup = db.execute_query("""
+            SELECT status, count, sum_score, n_score
+            FROM health_status_counts
+            WHERE count > 0
         """)
         
-        distribution = {row['status']: row['count'] for row in health_counts}
+        distribution = {row['status']: row['count'] for row in rollup if row['status'] != '__all__'}
         
-        # Calculate scores
-        avg_score = db.execute_query("SELECT AVG(health_score) as avg FROM health_records")[0]['avg']
+        # Calculate scores - the '__all__' row covers every record, NULL status included
+        totals = next((row for row in rollup if row['status'] == '__all__'), None)
+        avg_score = totals['sum_score'] / totals['n_score'] if totals and totals['n_score'] else None
         
         data['health_distribution'] = distribution
         data['key_metrics'] = {
@@ -157,9 +184,16 @@ def generate_report_data(report_type, filters=None):
 @reports_bp.route('/reports', methods=['GET'])
 def get_reports():
     try:
-        query = "SELECT * FROM reports ORDER BY created_at DESC"
+        # List view only needs metadata; the 'data' blob is served by GET /reports/<id>
+        query = """
+            SELECT report_id, report_type, title, description, format, created_at
+            FROM reports ORDER BY created_at DESC
+        """
+        if request.args.get('layout') == 'columnar':
+            # Columnar layout: one header + tuple rows, no per-row dict allocation
+            columns, rows = db.execute_query_fast(query)
+            return raw_success_response(to_json({"columns": columns, "rows": rows}))
         reports = db.execute_query(query)
-        # Parse data JSON for list view if needed (optional)
         return success_response({"reports": [dict(r) for r in reports]})
     except Exception as e:
         logger.error(f"Reports Error: {e}")
@@ -206,7 +240,7 @@ def generate_report():
         
         # 1. Generate Data
         report_content = generate_report_data(report_type, filters)
-        json_content = json.dumps(report_content)
+        json_content = to_json(report_content)
         
         # 2. Save to DB
         query = """
@@ -222,12 +256,11 @@ def generate_report():
             json_content
         ))
         
-        # Return success with data for preview
-        return success_response({
-            "message": "Report generated successfully",
-            "report_id": report_id,
-            "data": report_content
-        })
+        # Return success with data for preview, reusing the already-encoded content
+        return raw_success_response(
+            '{"message":"Report generated successfully","report_id":' + str(report_id)
+            + ',"data":' + json_content + '}'
+        )
     except Exception as e:
         logger.error(f"Generate Report Error: {e}")
         return error_response(str(e))
@@ -257,28 +290,27 @@ def download_report(report_id):
         requested_format = request.args.get('format', default_fmt).upper()
 
         if requested_format == 'CSV':
-            si = io.StringIO()
-            cw = csv.writer(si)
-            
+            filename = f"INSTITUTIONAL_REPORT_{report_id}_{datetime.now().strftime('%Y%m%d')}.csv"
+
             # Mission-Critical Data Flattening
-            if 'records' in content_data and isinstance(content_data['records'], list) and content_data['records']:
-                headers = list(content_data['records'][0].keys())
-                cw.writerow(headers)
-                for row in content_data['records']:
-                    cw.writerow([str(row.get(k, '')) for k in headers])
-            elif 'details' in content_data and isinstance(content_data['details'], list) and content_data['details']:
-                headers = list(content_data['details'][0].keys())
-                cw.writerow(headers)
-                for row in content_data['details']:
-                    cw.writerow([str(row.get(k, '')) for k in headers])
+            rows = None
+            for key in ('records', 'details'):
+                if key in content_data and isinstance(content_data[key], list) and content_data[key]:
+                    rows = content_data[key]
+                    break
+
+            if rows is not None:
+                emitter = _csv_emitter(r_data.get('report_type'), tuple(rows[0].keys()))
+                output = Response(emitter(rows), mimetype='text/csv')
             else:
+                si = io.StringIO()
+                cw = csv.writer(si)
                 cw.writerow(['ARCHIVE_METRIC', 'CALIBRATED_VALUE'])
                 for k, v in content_data.items():
                     if k not in ['records', 'details']:
                         cw.writerow([k.upper(), str(v)])
+                output = make_response(si.getvalue())
 
-            output = make_response(si.getvalue())
-            filename = f"INSTITUTIONAL_REPORT_{report_id}_{datetime.now().strftime('%Y%m%d')}.csv"
             output.headers["Content-Disposition"] = f"attachment; filename={filename}"
             output.headers["Content-type"] = "text/csv"
             return output
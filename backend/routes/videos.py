@@ -5,7 +5,6 @@ from utils.response import success_response, error_response
 import logging
 import threading
 from bio_engine import bio_engine, BioProcessingError, CodecError, StorageError
-import sqlite3
 
 videos_bp = Blueprint('videos', __name__)
 logger = logging.getLogger(__name__)
@@ -35,10 +34,10 @@ def process_video_background(video_id, video_path, db_path):
         _fail_video_job(db_path, video_id, "SYSTEM_FAULT", str(e))
 
 def _fail_video_job(db_path, video_id, error_code, details):
-    with sqlite3.connect(db_path) as conn:
-        conn.execute("UPDATE videos SET processing_status='Failed', progress=0, error_message=? WHERE video_id=?", 
-                     (f"{error_code}: {details}", video_id))
-        conn.commit()
+    # Reuse the blueprint's WAL-configured connection instead of an ad-hoc DELETE-journal one
+    manager = db if db_path == db.db_path else DatabaseManager(db_path)
+    manager.execute_update("UPDATE videos SET processing_status='Failed', progress=0, error_message=? WHERE video_id=?",
+                           (f"{error_code}: {details}", video_id))
 
 @videos_bp.route('/videos', methods=['GET'])
 def get_videos():
@@ -85,8 +84,13 @@ def create_video():
             video_id = db.execute_update(query, (filename, file_path, file_size, json.dumps(metadata)))
             
             # Use simulation for JSON/Simulated nodes
-            from simulation import start_simulation_thread
-            start_simulation_thread(video_id, filename, scenario)
+            from simulation import start_simulation_thread, SimulationQueueFull
+            try:
+                start_simulation_thread(video_id, filename, scenario)
+            except SimulationQueueFull as e:
+                db.execute_update("UPDATE videos SET processing_status = 'Failed', error_message = ? WHERE video_id = ?",
+                                  (f"QUEUE_FULL: {e}", video_id))
+                return error_response(str(e), 429)
             
             return success_response({
                 "video_id": video_id,
@@ -1,115 +1,238 @@
 import time
 import random
 import json
+import os
 import threading
-import math
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from array import array
+import numpy as np
 from datetime import datetime, timedelta
 from database import DatabaseManager
 from config import config
+from utils.response import to_json
+from utils.goat_roster import get_active_goats
 
 # Initialize DB Manager
 db = DatabaseManager()
 
-class GoatSimulator:
-    def __init__(self, goat_data, scenario='Standard'):
+# Statement text is kept constant so sqlite3's per-connection statement cache can reuse the prepared plan
+DETECTION_INSERT_SQL = '''
+    INSERT INTO detections (
+        video_id, goat_id, timestamp, ear_tag_detected, 
+        bounding_box_x, bounding_box_y, bounding_box_w, bounding_box_h,
+        confidence_score, health_score, activity_label, gait_status, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+EVENT_INSERT_SQL = '''
+    INSERT INTO events (goat_id, video_id, event_type, severity, title, description, timestamp)
+    VALUES (?, ?, 'SIGHTING', 'Low', 'Identity Lock Established', ?, ?)
+'''
+
+# Per-state behavior table: (speed, health, heart rate, respiration, temperature, activities, gait).
+# Goats carry an integer state code; every parameter is fetched by indexing, never by branching.
+STATE_PARAMS = {
+    'Healthy':    (0.02,  (85, 100), (70, 90),   (20, 30), (38.5, 39.5), ('Grazing', 'Walking', 'Standing'), 'Normal'),
+    'Sick':       (0.005, (40, 65),  (50, 70),   (15, 25), (39.5, 41.0), ('Resting', 'Lying Down', 'Standing'), 'Abnormal'),
+    'Aggressive': (0.05,  (90, 100), (110, 160), (35, 60), (39.5, 40.5), ('Running', 'Running', 'Running'), 'Normal'),
+}
+STATE_NAMES = tuple(STATE_PARAMS)
+HEALTHY, SICK, AGGRESSIVE = (STATE_NAMES.index(name) for name in ('Healthy', 'Sick', 'Aggressive'))
+
+SPEED = np.array([p[0] for p in STATE_PARAMS.values()])
+HEALTH_RANGE = np.array([p[1] for p in STATE_PARAMS.values()])
+HEART_RATE_RANGE = np.array([p[2] for p in STATE_PARAMS.values()])
+RESPIRATION_RANGE = np.array([p[3] for p in STATE_PARAMS.values()])
+TEMPERATURE_RANGE = np.array([p[4] for p in STATE_PARAMS.values()])
+ACTIVITIES = tuple(p[5] for p in STATE_PARAMS.values())
+GAITS = tuple(p[6] for p in STATE_PARAMS.values())
+
+# Plain NumPy on purpose: a run steps a handful of goats for ~60 frames, so a
+# numba kernel's import + compile (~0.7 s) never pays back its ~8 us/frame gain.
+def step_herd(pos, vel, dvel, speed_out):
+    """Advance positions/velocities one frame in place; writes |velocity| into speed_out."""
+    vel += dvel
+    vel *= 0.9  # Dampen velocity
+    pos += vel
+    np.clip(pos, 0, 1, out=pos)
+    np.hypot(vel[0], vel[1], out=speed_out)
+
+class Herd:
+    """
+    Struct-of-arrays herd simulator.
+    Positions, velocities and vitals for every goat live in NumPy arrays so a
+    frame is one vectorized step instead of a Python loop over goats. All random
+    draws for the run are generated up front as (frames, N) streams.
+    """
+    def __init__(self, goats_data, scenario='Standard', frame_count=60, rng=None):
         if not config.ALLOW_MOCK_DATA:
             raise RuntimeError("CRITICAL_SECURITY_ERR: Simulation engine active in PRODUCTION mode. Hard blocking execution.")
         
-        self.goat = goat_data
+        self.goats = list(goats_data)
         self.scenario = scenario
-        self.state = self._initial_state()
-        self.position = {'x': random.uniform(0.1, 0.9), 'y': random.uniform(0.1, 0.9)}
-        self.velocity = {'x': 0, 'y': 0}
-        
-        # Vitals
-        self.heart_rate = 80
-        self.respiration_rate = 25
-        self.temperature = 39.0
-        self.social_group_id = None
+        self.size = len(self.goats)
+        self.frame_count = frame_count
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.state = self._initial_states()
+        self.pos = self.rng.uniform(0.1, 0.9, size=(2, self.size))
+        self.vel = np.zeros((2, self.size))
+        self.social_group_id = np.zeros(self.size, dtype=np.int64)  # 0 == no group
+        self.speed = np.zeros(self.size)
+        self._draw_streams()
     
-    def _initial_state(self):
+    def _initial_states(self):
         """Determine initial health and behavior based on scenario."""
-        if self.scenario == 'Disease Outbreak' and random.random() < 0.4:
-            return 'Sick'
-        elif self.scenario == 'Aggression' and random.random() < 0.3:
-            return 'Aggressive'
-        return 'Healthy'
-
-    def update(self):
-        """Update goat position and state for next frame."""
-        # Behavior logic
-        if self.state == 'Healthy':
-            speed = 0.02
-            self.health_score = random.randint(85, 100)
-            self.activity = random.choice(['Grazing', 'Walking', 'Standing'])
-            self.gait = 'Normal'
-            
-            # Normal Vitals
-            self.heart_rate = random.randint(70, 90)
-            self.respiration_rate = random.randint(20, 30)
-            self.temperature = round(random.uniform(38.5, 39.5), 1)
-            
-        elif self.state == 'Sick':
-            speed = 0.005 # Lethargic
-            self.health_score = random.randint(40, 65)
-            self.activity = random.choice(['Resting', 'Lying Down', 'Standing'])
-            self.gait = 'Abnormal'
-            
-            # Sick Vitals (Fever, Low HR)
-            self.heart_rate = random.randint(50, 70)
-            self.respiration_rate = random.randint(15, 25)
-            self.temperature = round(random.uniform(39.5, 41.0), 1)
-            
-        elif self.state == 'Aggressive':
-            speed = 0.05 # Fast
-            self.health_score = random.randint(90, 100)
-            self.activity = 'Running'
-            self.gait = 'Normal'
-            
-            # Aggressive Vitals (High HR)
-            self.heart_rate = random.randint(110, 160)
-            self.respiration_rate = random.randint(35, 60)
-            self.temperature = round(random.uniform(39.5, 40.5), 1)
-
-        # Move goat
-        self.velocity['x'] += random.uniform(-speed, speed)
-        self.velocity['y'] += random.uniform(-speed, speed)
+        state = np.full(self.size, HEALTHY, dtype=np.int64)
+        if self.scenario == 'Disease Outbreak':
+            state[self.rng.random(self.size) < 0.4] = SICK
+        elif self.scenario == 'Aggression':
+            state[self.rng.random(self.size) < 0.3] = AGGRESSIVE
+        return state
+
+    def _draw_streams(self):
+        """Pre-generate every per-frame random draw, sized (frame_count, N)."""
+        rng, state = self.rng, self.state
+        shape = (self.frame_count, self.size)
         
-        # Dampen velocity
-        self.velocity['x'] *= 0.9
-        self.velocity['y'] *= 0.9
+        # Behavior & vitals, sampled per goat from its state's ranges
+        health, hr, rr, temp = (np.take(table, state, axis=0).T
+                                for table in (HEALTH_RANGE, HEART_RATE_RANGE, RESPIRATION_RANGE, TEMPERATURE_RANGE))
+        self.health_score = rng.integers(health[0], health[1], size=shape, endpoint=True)
+        self.heart_rate = rng.integers(hr[0], hr[1], size=shape, endpoint=True)
+        self.respiration_rate = rng.integers(rr[0], rr[1], size=shape, endpoint=True)
+        self.temperature = np.round(rng.uniform(temp[0], temp[1], size=shape), 1)
+        self.activity_idx = rng.integers(0, 3, size=shape)
+
+        speed = np.take(SPEED, state)
+        self.dvel = rng.uniform(-speed, speed, size=(self.frame_count, 2, self.size))
+        self.size_wh = rng.uniform(0.35, 0.45, size=(self.frame_count, 2, self.size)) # Mass simulation
         
-        self.position['x'] = max(0, min(1, self.position['x'] + self.velocity['x']))
-        self.position['y'] = max(0, min(1, self.position['y'] + self.velocity['y']))
+        self.group_draws = rng.random((self.frame_count, 2, self.size))
+        self.group_ids = rng.integers(1, 4, size=shape)
+
+    def update(self, frame_idx, minimal=False):
+        """
+        Advance every goat to frame `frame_idx`.
+        Returns per-goat observation columns as plain Python lists (sqlite-ready).
+        With minimal=True the vitals metadata JSON is skipped and stored as "{}".
+        """
+        n, state = self.size, self.state
+
+        # Move goats (in place: positions/velocities stay (2, N) buffers)
+        step_herd(self.pos, self.vel, self.dvel[frame_idx], self.speed)
         
         # Simulate Social Grouping (Clustering)
         # In a real system, this would calculate distance to others.
         # Here we simulate it by randomly assigning a group ID occasionally.
-        if random.random() < 0.1:
-            self.social_group_id = random.randint(1, 3)
-        elif random.random() < 0.1:
-            self.social_group_id = None
-
-        metadata = {
-            'heart_rate': self.heart_rate,
-            'respiration_rate': self.respiration_rate,
-            'temperature': self.temperature,
-            'social_group_id': self.social_group_id,
-            'velocity': math.sqrt(self.velocity['x']**2 + self.velocity['y']**2)
-        }
+        join = self.group_draws[frame_idx, 0] < 0.1
+        leave = ~join & (self.group_draws[frame_idx, 1] < 0.1)
+        self.social_group_id[join] = self.group_ids[frame_idx, join]
+        self.social_group_id[leave] = 0
 
+        if minimal:
+            metadata = ['{}'] * n
+        else:
+            hr = self.heart_rate[frame_idx].tolist()
+            rr = self.respiration_rate[frame_idx].tolist()
+            temp = self.temperature[frame_idx].tolist()
+            groups, vel = self.social_group_id.tolist(), self.speed.tolist()
+            metadata = [
+                to_json({
+                    'heart_rate': hr[g],
+                    'respiration_rate': rr[g],
+                    'temperature': temp[g],
+                    'social_group_id': groups[g] or None,
+                    'velocity': vel[g]
+                })
+                for g in range(n)
+            ]
+        
+        codes = state.tolist()
+        activity_idx = self.activity_idx[frame_idx].tolist()
         return {
-            'x': self.position['x'],
-            'y': self.position['y'],
-            'w': random.uniform(0.35, 0.45), # Mass simulation
-            'h': random.uniform(0.35, 0.45),
-            'health_score': self.health_score,
-            'activity': self.activity,
-            'gait': self.gait,
-            'state': self.state,
-            'metadata': json.dumps(metadata)
+            'x': self.pos[0].tolist(),
+            'y': self.pos[1].tolist(),
+            'w': self.size_wh[frame_idx, 0].tolist(),
+            'h': self.size_wh[frame_idx, 1].tolist(),
+            'health_score': self.health_score[frame_idx].tolist(),
+            'activity': [ACTIVITIES[c][a] for c, a in zip(codes, activity_idx)],
+            'gait': [GAITS[c] for c in codes],
+            'state': [STATE_NAMES[c] for c in codes],
+            'metadata': metadata
         }
 
+class DetectionBuffer:
+    """
+    Columnar staging area for one video's detection rows.
+    Numeric fields go into typed array.array columns (no per-row tuple/float
+    objects); flush() zips the columns back into rows for a single executemany.
+    """
+    def __init__(self, video_id):
+        self.video_id = video_id
+        self._reset()
+
+    def _reset(self):
+        """Start every column empty; used by __init__ and after each flush()."""
+        self.goat_id = array('q')
+        self.timestamp = []
+        self.ear_tag = []
+        self.x, self.y, self.w, self.h = array('d'), array('d'), array('d'), array('d')
+        self.confidence = array('d')
+        self.health_score = array('q')
+        self.activity = []
+        self.gait = []
+        self.metadata = []
+
+    def __len__(self):
+        return len(self.goat_id)
+
+    def append(self, goat_id, timestamp, ear_tag, x, y, w, h, confidence, health_score, activity, gait, metadata):
+        self.goat_id.append(goat_id)
+        self.timestamp.append(timestamp)
+        self.ear_tag.append(ear_tag)
+        self.x.append(x)
+        self.y.append(y)
+        self.w.append(w)
+        self.h.append(h)
+        self.confidence.append(confidence)
+        self.health_score.append(health_score)
+        self.activity.append(activity)
+        self.gait.append(gait)
+        self.metadata.append(metadata)
+
+    def flush(self, database):
+        """Insert all buffered rows with one executemany and reset the buffer."""
+        if not len(self):
+            return 0
+        rows = zip(
+            itertools.repeat(self.video_id), self.goat_id, self.timestamp, self.ear_tag,
+            self.x, self.y, self.w, self.h,
+            self.confidence, self.health_score, self.activity, self.gait, self.metadata
+        )
+        count = database.execute_many(DETECTION_INSERT_SQL, rows)
+        self._reset()
+        return count
+
+# Detection detail: 'full' stores per-detection vitals metadata, 'minimal' only bbox + identity
+SIM_DETAIL = os.environ.get('SIM_DETAIL', 'full').lower()
+
+# Frames committed per transaction: one fsync per chunk instead of per statement,
+# while pollers still see progress move between chunks.
+TX_CHUNK_FRAMES = 10
+
+_worker_local = threading.local()
+
+def _worker_db():
+    """
+    DatabaseManager owned by the calling thread, opened once per pool worker.
+    Runs on the same worker reuse its configured connection instead of reconnecting.
+    """
+    manager = getattr(_worker_local, 'db', None)
+    if manager is None:
+        manager = _worker_local.db = DatabaseManager(db.db_path)
+    return manager
+
 def run_video_simulation(video_id, filename, scenario='Standard'):
     """
     CANONICAL PIPELINE: Detection -> Tracking -> Identity Resolution -> Analytics
@@ -117,84 +240,78 @@ def run_video_simulation(video_id, filename, scenario='Standard'):
     """
     print(f"COMMENCING IDENTITY-LOCKED SIMULATION: Video {video_id} [{scenario}]")
     
-    db.execute_update("UPDATE videos SET processing_status = 'Processing', progress = 0 WHERE video_id = ?", (video_id,))
+    # Per-worker connection so this thread's transactions don't absorb other writers
+    sim_db = _worker_db()
+    sim_db.execute_update("UPDATE videos SET processing_status = 'Processing', progress = 0 WHERE video_id = ?", (video_id,))
     
     try:
         # STAGE 0: DATA ACQUISITION
-        goats_data = db.execute_query("SELECT goat_id, ear_tag FROM goats WHERE status = 'Active'")
+        goats_data = get_active_goats(sim_db)
         if not goats_data: 
-            db.execute_update("UPDATE videos SET processing_status = 'Completed', detections_count = 0, metadata = '{\"identified_count\": 0}' WHERE video_id = ?", (video_id,))
+            sim_db.execute_update("UPDATE videos SET processing_status = 'Completed', detections_count = 0, metadata = '{\"identified_count\": 0}' WHERE video_id = ?", (video_id,))
             return
 
         # STAGE 2: TEMPORAL TRACKING (Simulate 1-5 unique goats)
         ground_truth_count = random.randint(1, min(5, len(goats_data)))
-        active_goats = random.sample(goats_data, k=ground_truth_count)
+        # Sample indices rather than the rows themselves so the population list isn't copied
+        active_goats = [goats_data[idx] for idx in random.sample(range(len(goats_data)), ground_truth_count)]
         
         # Track IDs (Persistent associations)
-        # One physical goat -> One Track ID
-        track_map = {idx: GoatSimulator(g, scenario) for idx, g in enumerate(active_goats)}
-        
+        # One physical goat -> One Track ID (its index in the herd arrays)
         frame_count = 60
+        herd = Herd(active_goats, scenario, frame_count)
+        visible = herd.rng.random((frame_count, herd.size)) > 0.05 # 95% detection rate
         raw_detections_noise = 0
         identity_locks = set() # Finalized Biometric Locks
+        last_bucket = -1
+        event_params = [] # Identity-lock sightings, flushed with the detections
+        detections = DetectionBuffer(video_id) # Flushed in one executemany once all frames are simulated
         
         print(f"GROUND TRUTH: {ground_truth_count} physical entities. Commencing track analysis...")
+        uniform = random.uniform
 
-        for i in range(frame_count):
-            # STAGE 1: FRAME-LEVEL DETECTION (Ephemeral)
-            frame_detections = []
-            detection_params = []
-            
-            for track_id, sim in track_map.items():
-                if random.random() > 0.05: # 95% detection rate
-                    data = sim.update()
-                    frame_detections.append({
-                        'track_id': track_id,
-                        'goat_data': sim.goat,
-                        'obs': data
-                    })
-                    raw_detections_noise += 1
+        for chunk_start in range(0, frame_count, TX_CHUNK_FRAMES):
+            with sim_db.transaction():
+                for i in range(chunk_start, min(chunk_start + TX_CHUNK_FRAMES, frame_count)):
+                    # STAGE 1: FRAME-LEVEL DETECTION (Ephemeral)
+                    # One clock read + format per frame, shared by all rows (skips sqlite3's per-row datetime adapter)
+                    frame_ts = datetime.now().isoformat(sep=' ', timespec='seconds')
+                    obs = herd.update(i, minimal=SIM_DETAIL == 'minimal')
+                    detected = np.flatnonzero(visible[i]).tolist()
+                    raw_detections_noise += len(detected)
                     
                     # Accumulate for batch insert
-                    detection_params.append((
-                        video_id, sim.goat['goat_id'], datetime.now(), sim.goat['ear_tag'],
-                        data['x'], data['y'], data['w'], data['h'],
-                        random.uniform(0.92, 0.99), data['health_score'], 
-                        data['activity'], data['gait'], data['metadata']
-                    ))
-
-            # STAGE 3-5: TRACK CONSOLIDATION & IDENTITY RESOLUTION
-            if i == 30: 
-                for track_id, sim in track_map.items():
-                    identity_locks.add(sim.goat['goat_id'])
-                    db.execute_update('''
-                        INSERT INTO events (goat_id, video_id, event_type, severity, title, description, timestamp)
-                        VALUES (?, ?, 'SIGHTING', 'Low', 'Identity Lock Established', ?, ?)
-                    ''', (
-                        sim.goat['goat_id'], video_id, 
-                        f"Biometric signature match confirmed for {sim.goat['ear_tag']} via Temporal Consistency Engine.",
-                        datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    ))
-
-            # STAGE 6: BATCH DATABASE UPLINK (Optimization)
-            if detection_params:
-                db.execute_many('''
-                    INSERT INTO detections (
-                        video_id, goat_id, timestamp, ear_tag_detected, 
-                        bounding_box_x, bounding_box_y, bounding_box_w, bounding_box_h,
-                        confidence_score, health_score, activity_label, gait_status, metadata
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', detection_params)
-
-            # Update REAL Progress
-            progress = int(((i + 1) / frame_count) * 100)
-            db.execute_update("UPDATE videos SET progress = ? WHERE video_id = ?", (progress, video_id))
+                    for track_id in detected:
+                        goat = herd.goats[track_id]
+                        detections.append(
+                            goat['goat_id'], frame_ts, goat['ear_tag'],
+                            obs['x'][track_id], obs['y'][track_id], obs['w'][track_id], obs['h'][track_id],
+                            uniform(0.92, 0.99), obs['health_score'][track_id], 
+                            obs['activity'][track_id], obs['gait'][track_id], obs['metadata'][track_id]
+                        )
+
+                    # STAGE 3-5: TRACK CONSOLIDATION & IDENTITY RESOLUTION
+                    if i == 30: 
+                        for goat in herd.goats:
+                            identity_locks.add(goat['goat_id'])
+                            event_params.append((
+                                goat['goat_id'], video_id, 
+                                f"Biometric signature match confirmed for {goat['ear_tag']} via Temporal Consistency Engine.",
+                                frame_ts
+                            ))
+
+                    # Update REAL Progress (only when it crosses a 10% bucket)
+                    progress = int(((i + 1) / frame_count) * 100)
+                    bucket = progress // 10
+                    if bucket != last_bucket:
+                        last_bucket = bucket
+                        sim_db.execute_update("UPDATE videos SET progress = ? WHERE video_id = ?", (progress, video_id))
 
         # FINAL RESOLUTION
         identified_count = len(identity_locks)
         
-        if identified_count > len(track_map):
-            raise ValueError(f"INVARIANT VIOLATION: {identified_count} > {len(track_map)}")
+        if identified_count > herd.size:
+            raise ValueError(f"INVARIANT VIOLATION: {identified_count} > {herd.size}")
 
         metadata_summary = {
             'identified_count': identified_count,
@@ -204,26 +321,47 @@ def run_video_simulation(video_id, filename, scenario='Standard'):
             'pipeline_version': 'v4.2-identity-locked'
         }
 
-        db.execute_update('''
-            UPDATE videos 
-            SET processing_status = 'Completed', 
-                detections_count = ?,
-                processed_date = CURRENT_TIMESTAMP,
-                metadata = ?
-            WHERE video_id = ?
-        ''', (identified_count, json.dumps(metadata_summary), video_id))
+        with sim_db.transaction():
+            # STAGE 6: BATCH DATABASE UPLINK (detections + events + status commit atomically)
+            detections.flush(sim_db)
+            if event_params:
+                sim_db.execute_many(EVENT_INSERT_SQL, event_params)
+
+            sim_db.execute_update('''
+                UPDATE videos 
+                SET processing_status = 'Completed', 
+                    detections_count = ?,
+                    processed_date = CURRENT_TIMESTAMP,
+                    metadata = ?
+                WHERE video_id = ?
+            ''', (identified_count, json.dumps(metadata_summary), video_id))
         
     except Exception as e:
         error_msg = f"PIPELINE CRASH: {str(e)}"
         print(error_msg)
-        db.execute_update("""
+        sim_db.execute_update("""
             UPDATE videos 
             SET processing_status = 'Failed', 
                 metadata = ? 
             WHERE video_id = ?
         """, (json.dumps({"error_message": error_msg}), video_id))
 
+# Bounded worker pool: SQLite serializes writers anyway, so more threads only add lock contention
+SIMULATION_WORKERS = min(8, os.cpu_count() or 1)
+SIMULATION_QUEUE_LIMIT = SIMULATION_WORKERS * 4
+EXECUTOR = ThreadPoolExecutor(max_workers=SIMULATION_WORKERS, thread_name_prefix='simulation')
+_pending_slots = threading.BoundedSemaphore(SIMULATION_QUEUE_LIMIT)
+
+class SimulationQueueFull(RuntimeError):
+    """Raised when the simulation pool already has SIMULATION_QUEUE_LIMIT jobs queued or running."""
+
 def start_simulation_thread(video_id, filename, scenario='Standard'):
-    thread = threading.Thread(target=run_video_simulation, args=(video_id, filename, scenario))
-    thread.daemon = True
-    thread.start()
+    if not _pending_slots.acquire(blocking=False):
+        raise SimulationQueueFull(f"Simulation queue full ({SIMULATION_QUEUE_LIMIT} jobs pending)")
+    try:
+        future = EXECUTOR.submit(run_video_simulation, video_id, filename, scenario)
+    except BaseException:
+        _pending_slots.release()  # e.g. RuntimeError after executor shutdown; don't leak the slot
+        raise
+    future.add_done_callback(lambda _: _pending_slots.release())
+    return future
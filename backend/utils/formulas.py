@@ -5,6 +5,9 @@ References:
 2. Mahgoub et al. (2012). "Goat Meat Production and Quality".
 """
 import math
+from functools import lru_cache
+
+import numpy as np
 
 # Allometric Coefficients (Sowande & Sobola, 2008 + Indian Regional Studies)
 ALLOMETRIC_COEFFICIENTS = {
@@ -21,27 +24,38 @@ ALLOMETRIC_COEFFICIENTS = {
 
 BCS_MULTIPLIERS = {1: 0.80, 2: 0.90, 3: 1.00, 4: 1.10, 5: 1.20}
 
+# Coefficient columns for the batch functions, indexed by an integer breed code.
+# Unknown breeds map to the 'Local' row, mirroring the scalar fallback.
+BREED_CODES = {breed: i for i, breed in enumerate(ALLOMETRIC_COEFFICIENTS)}
+_LOCAL_CODE = BREED_CODES['Local']
+_COEFF_A = np.array([c['a'] for c in ALLOMETRIC_COEFFICIENTS.values()])
+_COEFF_B = np.array([c['b'] for c in ALLOMETRIC_COEFFICIENTS.values()])
+_COEFF_C = np.array([c['c'] for c in ALLOMETRIC_COEFFICIENTS.values()])
+_BASE_DRESSING = np.array([c['base_dressing'] for c in ALLOMETRIC_COEFFICIENTS.values()])
+
+@lru_cache(maxsize=64)
+def _coeffs(breed: str) -> tuple:
+    """Resolve a breed to (a, b, c, base_dressing), falling back to 'Local'."""
+    c = ALLOMETRIC_COEFFICIENTS.get(breed, ALLOMETRIC_COEFFICIENTS['Local'])
+    return c['a'], c['b'], c['c'], c['base_dressing']
+
 def calculate_mass(breed: str, length_m: float, height_m: float) -> float:
     """
     Calculate base mass using allometric scaling.
     Formula: M = a * L^b * H^c
     """
-    coeffs = ALLOMETRIC_COEFFICIENTS.get(breed, ALLOMETRIC_COEFFICIENTS['Local'])
-    return coeffs['a'] * (length_m ** coeffs['b']) * (height_m ** coeffs['c'])
+    a, b, c, _ = _coeffs(breed)
+    return a * (length_m ** b) * (height_m ** c)
 
 def calculate_meat_yield(mass_kg: float, bcs: int, breed: str) -> dict:
     """
     Calculate full carcass breakdown.
     Returns: { 'hot_carcass': float, 'cold_carcass': float, 'boneless': float, 'dressing_pct': float }
     """
-    coeffs = ALLOMETRIC_COEFFICIENTS.get(breed, ALLOMETRIC_COEFFICIENTS['Local'])
-    base_dressing = coeffs['base_dressing']
+    base_dressing = _coeffs(breed)[3]
     
-    # Mass adjustment
-    mass_adj = 0.0
-    if mass_kg > 60: mass_adj = 0.03
-    elif mass_kg > 45: mass_adj = 0.02
-    elif mass_kg > 30: mass_adj = 0.01
+    # Mass adjustment: +0.01 for each of the 30/45/60 kg thresholds exceeded
+    mass_adj = 0.01 * ((mass_kg > 30) + (mass_kg > 45) + (mass_kg > 60))
     
     # BCS adjustment
     bcs_adj = (bcs - 3) * 0.02
@@ -58,3 +72,41 @@ def calculate_meat_yield(mass_kg: float, bcs: int, breed: str) -> dict:
         'boneless_meat_kg': round(boneless, 2),
         'dressing_pct': dressing_pct
     }
+
+def breed_codes(breeds) -> np.ndarray:
+    """Map breed names to coefficient row indices (unknown -> 'Local')."""
+    return np.fromiter((BREED_CODES.get(b, _LOCAL_CODE) for b in breeds), dtype=np.intp)
+
+def calculate_mass_batch(breeds, lengths_m, heights_m) -> np.ndarray:
+    """
+    Vectorized calculate_mass for a whole herd.
+    Returns an array of masses aligned with the inputs.
+    """
+    codes = breed_codes(breeds)
+    L = np.asarray(lengths_m, dtype=np.float64)
+    H = np.asarray(heights_m, dtype=np.float64)
+    return _COEFF_A[codes] * np.power(L, _COEFF_B[codes]) * np.power(H, _COEFF_C[codes])
+
+def calculate_meat_yield_batch(masses_kg, bcs, breeds) -> dict:
+    """
+    Vectorized calculate_meat_yield.
+    Returns a dict of arrays with the same keys as the scalar version.
+    """
+    codes = breed_codes(breeds)
+    mass = np.asarray(masses_kg, dtype=np.float64)
+    bcs = np.asarray(bcs, dtype=np.float64)
+
+    mass_adj = 0.01 * ((mass > 30).astype(np.float64) + (mass > 45) + (mass > 60))
+    bcs_adj = (bcs - 3) * 0.02
+    dressing_pct = np.minimum(_BASE_DRESSING[codes] + mass_adj + bcs_adj, 0.56)
+
+    hot_carcass = mass * dressing_pct
+    cold_carcass = hot_carcass * 0.98
+    boneless = cold_carcass * 0.75
+
+    return {
+        'hot_carcass_kg': np.round(hot_carcass, 2),
+        'cold_carcass_kg': np.round(cold_carcass, 2),
+        'boneless_meat_kg': np.round(boneless, 2),
+        'dressing_pct': dressing_pct
+    }
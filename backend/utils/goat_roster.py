@@ -0,0 +1,34 @@
+"""
+Cached roster of Active goats, keyed by database file.
+Kept free of engine/simulator imports so goat registration paths can
+invalidate it without pulling anything else in.
+"""
+import os
+import threading
+import time
+
+# The goats table changes rarely; registrations invalidate explicitly, and the
+# TTL only bounds staleness for writes made from other processes.
+ACTIVE_GOATS_TTL = 30.0  # seconds
+
+_cache = {}  # realpath(db_path) -> (monotonic fetch time, rows)
+_lock = threading.Lock()
+
+def _key(db_path: str) -> str:
+    return os.path.realpath(db_path)
+
+def get_active_goats(database):
+    """Return the Active goat rows for `database`, re-querying at most once per ACTIVE_GOATS_TTL."""
+    key = _key(database.db_path)
+    with _lock:
+        fetched_at, rows = _cache.get(key, (0.0, None))
+        now = time.monotonic()
+        if rows is None or now - fetched_at > ACTIVE_GOATS_TTL:
+            rows = database.execute_query("SELECT goat_id, ear_tag FROM goats WHERE status = 'Active'")
+            _cache[key] = (now, rows)
+        return rows
+
+def invalidate_active_goats_cache(db_path: str) -> None:
+    """Drop the cached roster for `db_path` after a goat-table write."""
+    with _lock:
+        _cache.pop(_key(db_path), None)
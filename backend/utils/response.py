@@ -1,39 +1,99 @@
-from flask import jsonify
-from datetime import datetime
+from flask import jsonify, Response
+import time
 from typing import Any, Optional
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    from flask.json.provider import DefaultJSONProvider
+
+    class OrjsonProvider(DefaultJSONProvider):
+        """
+        Flask JSON provider backed by orjson, so jsonify() and request.get_json()
+        skip the stdlib encoder. Types orjson does not know natively (Decimal,
+        objects with __html__, ...) go through Flask's default hook.
+        """
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z
+            if kwargs.get("sort_keys", self.sort_keys):
+                option |= orjson.OPT_SORT_KEYS
+            if kwargs.get("indent"):
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+
+        def loads(self, s: Any, **kwargs: Any) -> Any:
+            return orjson.loads(s)
+else:
+    OrjsonProvider = None
+
+def to_json(obj: Any) -> str:
+    """
+    Serialize to a JSON string (orjson when installed, stdlib otherwise)
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+API_VERSION = "2.0"
+
+# Static envelope skeletons; each response shallow-copies one and fills in the
+# per-request fields, so `meta` is always a fresh dict.
+_SUCCESS_TEMPLATE = {"success": True, "data": None, "meta": None, "error": None}
+_ERROR_TEMPLATE = {"success": False, "data": None, "meta": None, "error": None}
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the last second formatted. Swapped
+# as one tuple so concurrent requests never see a mismatched pair.
+_ts_cache = (0, "")
+
+def _timestamp() -> str:
+    """
+    UTC ISO-8601 timestamp with microseconds; the date/time prefix is formatted
+    at most once per second
+    """
+    global _ts_cache
+    now = time.time()
+    sec = int(now)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _ts_cache = (sec, prefix)
+    return f"{prefix}.{int((now - sec) * 1e6):06d}Z"
+
+def _meta(extra: Optional[dict] = None) -> dict:
+    meta = {"timestamp": _timestamp(), "version": API_VERSION}
+    if extra:
+        meta.update(extra)
+    return meta
 
 def success_response(data: Any, meta: Optional[dict] = None) -> tuple:
     """
     Standard Success Response Envelope
     """
-    response = {
-        "success": True,
-        "data": data,
-        "meta": {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "version": "2.0"
-        },
-        "error": None
-    }
-    if meta:
-        response["meta"].update(meta)
+    response = _SUCCESS_TEMPLATE.copy()
+    response["data"] = data
+    response["meta"] = _meta(meta)
     return jsonify(response), 200
 
+def raw_success_response(data_json: str, meta: Optional[dict] = None) -> tuple:
+    """
+    Standard Success Response Envelope around an already-serialized `data` payload
+    """
+    payload = '{"success":true,"data":' + data_json + ',"meta":' + to_json(_meta(meta)) + ',"error":null}'
+    return Response(payload, mimetype='application/json'), 200
+
 def error_response(message: str, code: int = 500, details: Optional[Any] = None) -> tuple:
     """
     Standard Error Response Envelope
     """
-    response = {
-        "success": False,
-        "data": None,
-        "meta": {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "version": "2.0"
-        },
-        "error": {
-            "code": code,
-            "message": message,
-            "details": details
-        }
+    response = _ERROR_TEMPLATE.copy()
+    response["meta"] = _meta()
+    response["error"] = {
+        "code": code,
+        "message": message,
+        "details": details
     }
     return jsonify(response), code
@@ -0,0 +1,21 @@
+"""
+SQLite connection tuning shared by DatabaseManager and the maintenance/debug
+scripts, so ad-hoc tools read the live WAL database with the same settings
+as the app instead of rollback-journal defaults.
+"""
+import sqlite3
+
+def apply_pragmas(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Apply the standard WAL/cache tuning to `conn` and return it."""
+    # WAL lets pollers (e.g. GET /api/videos) read while a simulation thread writes.
+    # synchronous=NORMAL is crash-safe under WAL; never use OFF here.
+    conn.execute("PRAGMA journal_mode = WAL")  # Enable Write-Ahead Logging
+    conn.execute("PRAGMA synchronous = NORMAL")  # Durable under WAL, one fsync per checkpoint
+    conn.execute("PRAGMA temp_store = MEMORY")  # Sorts/temp indexes stay off disk
+    conn.execute("PRAGMA cache_size = -65536")  # 64 MB page cache
+    conn.execute("PRAGMA mmap_size = 268435456")  # 256 MB memory-mapped reads
+    return conn
+
+def get_connection(db_path: str) -> sqlite3.Connection:
+    """Open a new tuned connection to `db_path`; the caller owns it and closes it."""
+    return apply_pragmas(sqlite3.connect(db_path))
@@ -1,17 +1,50 @@
 
 from backend.database import DatabaseManager
 import json
+import sys
 
 db = DatabaseManager()
 tables = ['goats', 'goat_positions', 'detections', 'events', 'feeding_records', 'health_records', 'reports']
 
+def estimated_counts():
+    """
+    Row-count estimates from sqlite_stat1 (written by ANALYZE). The first number
+    of each `stat` entry is the table's row count, so this is O(tables) instead
+    of a full scan. Returns {} when the database has never been analyzed.
+    """
+    try:
+        rows = db.execute_query(
+            "SELECT tbl, MAX(CAST(stat AS INTEGER)) AS c FROM sqlite_stat1 GROUP BY tbl"
+        )
+    except Exception:
+        return {}
+    return {r['tbl']: r['c'] for r in rows}
+
 print("--- DATABASE STATS ---")
+exact = '--exact' in sys.argv
+estimates = {} if exact else estimated_counts()
+if not exact and not estimates:
+    print("(no sqlite_stat1 - run ANALYZE for fast estimates; counting exactly)")
+
 for table in tables:
+    if table in estimates:
+        print(f"{table}: ~{estimates[table]} rows (sqlite_stat1 estimate)")
+
+to_count = [t for t in tables if t not in estimates]
+if to_count:
     try:
-        count = db.execute_query(f"SELECT COUNT(*) as c FROM {table}")[0]['c']
-        print(f"{table}: {count} rows")
-    except Exception as e:
-        print(f"{table}: Error {e}")
+        # All exact counts in one statement / one round-trip
+        sql = " UNION ALL ".join(f"SELECT '{t}' AS t, COUNT(*) AS c FROM {t}" for t in to_count)
+        for row in db.execute_query(sql):
+            print(f"{row['t']}: {row['c']} rows")
+    except Exception:
+        # A missing table fails the whole UNION; count one by one so the rest still report
+        for table in to_count:
+            try:
+                count = db.execute_query(f"SELECT COUNT(*) as c FROM {table}")[0]['c']
+                print(f"{table}: {count} rows")
+            except Exception as e:
+                print(f"{table}: Error {e}")
 
 print("\n--- DETECTIONS SAMPLE ---")
 try:
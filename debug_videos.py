@@ -1,8 +1,7 @@
-import sqlite3
-import json
+from backend.utils.sqlite_conn import get_connection
 
 db_path = r'c:\Users\uniqu\OneDrive\Desktop\Internship\farm-enterprise-premium\backend\data\goat_farm.db'
-conn = sqlite3.connect(db_path)
+conn = get_connection(db_path)
 cursor = conn.cursor()
 
 print("--- VIDEOS TABLE SCHEMA ---")
@@ -12,13 +11,19 @@ for col in columns:
     print(col)
 
 print("\n--- RECENT VIDEO DATA ---")
-cursor.execute("SELECT video_id, filename, total_goats, estimated_count, metadata FROM videos ORDER BY video_id DESC LIMIT 3")
+# Pull only the two metadata keys via SQLite JSON1 instead of decoding the whole blob in Python
+cursor.execute("""
+    SELECT video_id, filename, total_goats, estimated_count,
+           json_valid(metadata),
+           json_extract(CASE WHEN json_valid(metadata) THEN metadata END, '$.estimated_count'),
+           json_extract(CASE WHEN json_valid(metadata) THEN metadata END, '$.confidence_score')
+    FROM videos ORDER BY video_id DESC LIMIT 3
+""")
 rows = cursor.fetchall()
 for row in rows:
-    vid, fname, tg, ec, meta = row
+    vid, fname, tg, ec, has_meta, meta_count, meta_conf = row
     print(f"ID: {vid} | File: {fname} | total_goats: {tg} | estimated_count: {ec}")
-    if meta:
-        m = json.loads(meta)
-        print(f"  Metadata Count: {m.get('estimated_count')} | Stats: {m.get('confidence_score')}%")
+    if has_meta:
+        print(f"  Metadata Count: {meta_count} | Stats: {meta_conf}%")
 
 conn.close()
@@ -1,17 +1,43 @@
 import os
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 
 root_dir = r"c:\Users\uniqu\OneDrive\Desktop\Internship\farm-enterprise-premium\frontend\src"
 
-for subdir, dirs, files in os.walk(root_dir):
-    for file in files:
-        if file.endswith(".jsx") or file.endswith(".js"):
-            file_path = os.path.join(subdir, file)
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            
-            new_content = content.replace("http://localhost:5000/api", "/api")
-            
-            if content != new_content:
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(new_content)
-                print(f"Updated: {file_path}")
+OLD = "http://localhost:5000/api"
+NEW = "/api"
+OLD_BYTES = OLD.encode("utf-8")
+
+def contains_old_url(file_path):
+    # Probe via mmap so files without the URL are never decoded into a str
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(OLD_BYTES) != -1
+
+def process_file(file_path):
+    if not contains_old_url(file_path):
+        return None
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        content = f.read()
+    
+    new_content = content.replace(OLD, NEW)
+    
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write(new_content)
+    return file_path
+
+paths = [
+    os.path.join(subdir, file)
+    for subdir, dirs, files in os.walk(root_dir)
+    for file in files
+    if file.endswith(".jsx") or file.endswith(".js")
+]
+
+# File IO releases the GIL, so independent files can be probed/rewritten concurrently
+with ThreadPoolExecutor(max_workers=16) as ex:
+    for updated in ex.map(process_file, paths):
+        if updated:
+            print(f"Updated: {updated}")
@@ -1,15 +1,29 @@
-import sqlite3
 import os
+from backend.utils.sqlite_conn import get_connection
+
+SCHEMA_VERSION = 2
 
 db_path = os.path.join('backend', 'data', 'goat_farm.db')
 if not os.path.exists(db_path):
     print(f"Error: {db_path} not found")
     exit(1)
 
-conn = sqlite3.connect(db_path)
+# Autocommit mode so the BEGIN IMMEDIATE / COMMIT below are the only transaction boundaries
+conn = get_connection(db_path)
+conn.isolation_level = None
 cursor = conn.cursor()
 
 try:
+    version = cursor.execute("PRAGMA user_version").fetchone()[0]
+    if version >= SCHEMA_VERSION:
+        print(f"Database already at schema version {version}. Nothing to do.")
+        exit(0)
+
+    # All ALTERs and the version bump commit together (one fsync)
+    cursor.execute("BEGIN IMMEDIATE")
+
+    # Databases migrated before user_version was tracked may already have the
+    # columns, so the table_info checks still run - but only on this one pass.
     print("Checking 'events' table...")
     cursor.execute("PRAGMA table_info(events)")
     columns = [col[1] for col in cursor.fetchall()]
@@ -30,9 +44,12 @@ try:
         cursor.execute("ALTER TABLE videos ADD COLUMN progress INTEGER DEFAULT 0")
         print("'progress' column added.")
 
-    conn.commit()
+    cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    cursor.execute("COMMIT")
     print("\nDatabase migration successful.")
 except Exception as e:
+    if conn.in_transaction:
+        cursor.execute("ROLLBACK")
     print(f"Error: {e}")
 finally:
     conn.close()
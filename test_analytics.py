@@ -1,13 +1,26 @@
 import requests
+from requests.adapters import HTTPAdapter
 import json
 
 try:
-    response = requests.get('http://localhost:5000/api/analytics/mass')
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+BASE_URL = 'http://localhost:5000/api'
+
+# One pooled keep-alive session for every call in this script
+sess = requests.Session()
+sess.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+try:
+    response = sess.get(f'{BASE_URL}/analytics/mass', timeout=5, stream=False)
     print(f"Status Code: {response.status_code}")
     print(f"Response: {response.text[:2000]}")  # First 2000 chars
     
     if response.status_code == 200:
-        data = response.json()
+        data = _loads(response.content)
         print(f"\nSuccess! Returned {len(data)} goats")
         if len(data) > 0:
             print(f"First goat: {json.dumps(data[0], indent=2)}")
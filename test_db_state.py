@@ -5,30 +5,22 @@ from backend.database import DatabaseManager
 
 db = DatabaseManager()
 
-# Check goats
-goats = db.execute_query('SELECT COUNT(*) as count FROM goats')
-print(f'Total goats: {goats[0]["count"]}')
+# All five checks in one statement: scalar subqueries, one prepare/step, one row back
+stats = db.execute_query('''
+    SELECT
+        (SELECT COUNT(*) FROM goats) AS total_goats,
+        (SELECT COUNT(*) FROM goats WHERE status = 'Active') AS active_goats,
+        (SELECT COUNT(*) FROM detections) AS detections,
+        (SELECT COUNT(DISTINCT d.goat_id)
+           FROM detections d
+           JOIN goats g ON d.goat_id = g.goat_id
+          WHERE g.status = 'Active') AS active_with_detections,
+        (SELECT COUNT(*) FROM detections
+          WHERE bounding_box_w IS NOT NULL AND bounding_box_h IS NOT NULL) AS bbox_detections
+''')[0]
 
-# Check active goats
-active_goats = db.execute_query('SELECT COUNT(*) as count FROM goats WHERE status = "Active"')
-print(f'Active goats: {active_goats[0]["count"]}')
-
-# Check detections
-detections = db.execute_query('SELECT COUNT(*) as count FROM detections')
-print(f'Total detections: {detections[0]["count"]}')
-
-# Check if active goats have detections
-goats_with_detections = db.execute_query('''
-    SELECT COUNT(DISTINCT d.goat_id) as count
-    FROM detections d
-    JOIN goats g ON d.goat_id = g.goat_id
-    WHERE g.status = 'Active'
-''')
-print(f'Active goats with detections: {goats_with_detections[0]["count"]}')
-
-# Check bounding box data
-bbox_data = db.execute_query('''
-    SELECT COUNT(*) as count FROM detections 
-    WHERE bounding_box_w IS NOT NULL AND bounding_box_h IS NOT NULL
-''')
-print(f'Detections with bounding box data: {bbox_data[0]["count"]}')
+print(f'Total goats: {stats["total_goats"]}')
+print(f'Active goats: {stats["active_goats"]}')
+print(f'Total detections: {stats["detections"]}')
+print(f'Active goats with detections: {stats["active_with_detections"]}')
+print(f'Detections with bounding box data: {stats["bbox_detections"]}')
@@ -0,0 +1,94 @@
+"""
+TEST_FORMULAS_BATCH.py
+------------------------------------------------------------------------------
+Checks that the NumPy batch formulas match the scalar ones goat for goat
+------------------------------------------------------------------------------
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.getcwd(), 'backend'))
+
+from utils.formulas import (
+    ALLOMETRIC_COEFFICIENTS,
+    calculate_mass, calculate_meat_yield,
+    calculate_mass_batch, calculate_meat_yield_batch,
+)
+import numpy as np
+
+# Seeded generator: the random herd is the same every run
+rng = np.random.default_rng(0)
+N = 50_000
+
+# Known breeds plus unknown/NULL ones that must fall back to 'Local'
+BREEDS = list(ALLOMETRIC_COEFFICIENTS) + ['Unknown', None]
+
+def random_herd(n=N):
+    """Draw n goats over the ranges the analytics route clamps to."""
+    breeds = [BREEDS[i] for i in rng.integers(0, len(BREEDS), size=n)]
+    lengths = rng.uniform(0.5, 1.4, size=n)
+    heights = rng.uniform(0.4, 1.1, size=n)
+    bcs = rng.integers(1, 5, size=n, endpoint=True)
+    return breeds, lengths, heights, bcs
+
+def test_mass_batch():
+    """calculate_mass_batch == calculate_mass (np.power may differ by 1 ULP)"""
+    print("\n" + "="*70)
+    print(f"TEST 1: calculate_mass_batch vs calculate_mass ({N} goats)")
+    print("="*70)
+
+    breeds, lengths, heights, _ = random_herd()
+    batch = calculate_mass_batch(breeds, lengths, heights)
+    scalar = np.array([calculate_mass(b, L, H) for b, L, H in zip(breeds, lengths.tolist(), heights.tolist())])
+
+    max_rel = float(np.max(np.abs(batch - scalar) / scalar))
+    print(f"Max relative difference: {max_rel:.3g}")
+    assert np.allclose(batch, scalar, rtol=1e-12, atol=0), "Batch mass diverges from scalar mass"
+    assert np.array_equal(np.round(batch, 2), np.round(scalar, 2)), "Rounded masses differ"
+    print("✅ PASSED")
+
+def test_meat_yield_batch():
+    """calculate_meat_yield_batch == calculate_meat_yield, exactly, for every key"""
+    print("\n" + "="*70)
+    print(f"TEST 2: calculate_meat_yield_batch vs calculate_meat_yield ({N} goats)")
+    print("="*70)
+
+    breeds, lengths, heights, bcs = random_herd()
+    masses = calculate_mass_batch(breeds, lengths, heights)
+    batch = {k: v.tolist() for k, v in calculate_meat_yield_batch(masses, bcs, breeds).items()}
+
+    for i, (m, c, b) in enumerate(zip(masses.tolist(), bcs.tolist(), breeds)):
+        scalar = calculate_meat_yield(m, c, b)
+        for key, value in scalar.items():
+            assert batch[key][i] == value, f"{key} differs for goat {i}: {batch[key][i]} != {value}"
+    print("✅ PASSED")
+
+def test_threshold_edges():
+    """Mass ladder boundaries (30/45/60 kg) agree on both sides of each threshold"""
+    print("\n" + "="*70)
+    print("TEST 3: Mass-adjustment thresholds")
+    print("="*70)
+
+    masses = np.array([t + d for t in (30.0, 45.0, 60.0) for d in (-1e-9, 0.0, 1e-9)])
+    for breed in BREEDS:
+        breeds = [breed] * masses.size
+        for c in range(1, 6):
+            batch = calculate_meat_yield_batch(masses, [c] * masses.size, breeds)
+            for i, m in enumerate(masses.tolist()):
+                assert batch['dressing_pct'][i] == calculate_meat_yield(m, c, breed)['dressing_pct'], \
+                    f"dressing_pct differs at {m} kg (breed={breed}, bcs={c})"
+    print("✅ PASSED")
+
+if __name__ == "__main__":
+    try:
+        test_mass_batch()
+        test_meat_yield_batch()
+        test_threshold_edges()
+
+        print("\n" + "="*70)
+        print("✅ ALL TESTS PASSED")
+        print("="*70)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        sys.exit(1)
@@ -0,0 +1,111 @@
+"""
+TEST_HEALTH_ROLLUP.py
+------------------------------------------------------------------------------
+Checks the trigger-maintained health_status_counts roll-up against a direct
+scan of health_records, and the Health Summary report built on top of it
+------------------------------------------------------------------------------
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.getcwd(), 'backend'))
+
+from database import DatabaseManager
+import routes.reports as reports
+import numpy as np
+
+TEST_DB = "test_health_rollup.db"
+STATUSES = ['Excellent', 'Good', 'Fair', 'Poor', 'Critical', None]
+
+# Seeded generator: the record mix is the same every run
+rng = np.random.default_rng(0)
+
+def remove_db():
+    for path in (TEST_DB, TEST_DB + "-wal", TEST_DB + "-shm"):
+        if os.path.exists(path):
+            os.remove(path)
+
+def random_record():
+    """(status, health_score) with NULLs in both columns"""
+    status = STATUSES[rng.integers(len(STATUSES))]
+    score = None if rng.random() < 0.2 else int(rng.integers(0, 101))
+    return status, score
+
+def assert_rollup_matches(db):
+    """Roll-up rows and report metrics must equal a fresh scan of health_records"""
+    expected = {row['status']: row['count'] for row in db.execute_query(
+        "SELECT status, COUNT(*) AS count FROM health_records WHERE status IS NOT NULL GROUP BY status"
+    )}
+    avg = db.execute_query("SELECT AVG(health_score) AS avg FROM health_records")[0]['avg']
+
+    data = reports.generate_report_data('Health Summary')
+    assert data['health_distribution'] == expected, \
+        f"Distribution {data['health_distribution']} != scan {expected}"
+    assert abs(data['key_metrics']['average_health_score'] - (avg or 0)) < 1e-9, \
+        f"Average {data['key_metrics']['average_health_score']} != AVG(health_score) {avg}"
+
+def test_triggers(db):
+    """Inserts, updates and deletes (NULL status/score included) keep the roll-up exact"""
+    print("\n" + "="*70)
+    print("TEST 1: Roll-up follows INSERT / UPDATE / DELETE")
+    print("="*70)
+
+    goat_id = db.execute_update("INSERT INTO goats (ear_tag, status) VALUES ('HR-1', 'Active')")
+    db.execute_many(
+        "INSERT INTO health_records (goat_id, status, health_score) VALUES (?, ?, ?)",
+        [(goat_id, *random_record()) for _ in range(500)]
+    )
+    assert_rollup_matches(db)
+
+    ids = [row['record_id'] for row in db.execute_query("SELECT record_id FROM health_records")]
+    db.execute_many(
+        "UPDATE health_records SET status = ?, health_score = ? WHERE record_id = ?",
+        [(*random_record(), rid) for rid in ids[::3]]
+    )
+    assert_rollup_matches(db)
+
+    db.execute_many("DELETE FROM health_records WHERE record_id = ?", [(rid,) for rid in ids[::4]])
+    assert_rollup_matches(db)
+    print("✅ PASSED")
+
+def test_v1_upgrade(db):
+    """A database with the v1 triggers and no '__all__' row is upgraded on init"""
+    print("\n" + "="*70)
+    print("TEST 2: Upgrade from the v1 roll-up")
+    print("="*70)
+
+    conn = db.get_connection()
+    conn.execute("DELETE FROM health_status_counts WHERE status = '__all__'")
+    for name in ('ai', 'ad', 'au'):
+        conn.execute(f"DROP TRIGGER hr_rollup_{name}_v2")
+    conn.execute("CREATE TRIGGER hr_rollup_ai AFTER INSERT ON health_records BEGIN SELECT 1; END")
+    conn.commit()
+
+    DatabaseManager._initialized.clear()
+    db.initialize_database()
+
+    triggers = {row['name'] for row in db.execute_query("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+    assert 'hr_rollup_ai' not in triggers, "v1 trigger was not dropped"
+    assert {'hr_rollup_ai_v2', 'hr_rollup_ad_v2', 'hr_rollup_au_v2'} <= triggers, "v2 triggers missing"
+    assert_rollup_matches(db)
+    print("✅ PASSED")
+
+if __name__ == "__main__":
+    remove_db()
+    db = DatabaseManager(TEST_DB)
+    db.initialize_database()
+    reports.db = db
+    try:
+        test_triggers(db)
+        test_v1_upgrade(db)
+
+        print("\n" + "="*70)
+        print("✅ ALL TESTS PASSED")
+        print("="*70)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+        remove_db()
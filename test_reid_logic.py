@@ -4,10 +4,8 @@ import os
 sys.path.append(os.path.join(os.getcwd(), 'backend'))
 
 import numpy as np
-import cv2
-import json
-import random
 import logging
+import functools
 from backend.ai_engine import AIEngine
 from backend.database import DatabaseManager
 
@@ -25,35 +23,48 @@ logger = logging.getLogger("TestAIReID")
 
 # Mock AI Engine to skip Ultralytics and use synthetic signatures
 class TestAIEngine(AIEngine):
-    def __init__(self, db_path):
+    def __init__(self, db_path, db=None):
         self.db_path = db_path
+        # Share the caller's manager (one connection) rather than opening another
+        self.db = db if db is not None else DatabaseManager(db_path)
         self.model_version = "TEST-MOCK-v1"
         self.is_available = True
         logger.info("Test AI Engine Initialized")
 
     # MOCK: Generate synthetic signatures directly instead of from frames
     # Real signature is 3x3 grid * (8+8) bins = 144 float values
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _raw_sig(base_pattern_id):
+        # Deterministic "base" signature for this goat (pre-normalization)
+        raw = np.random.default_rng(base_pattern_id).random(144, dtype=np.float32)
+        raw.setflags(write=False)
+        return raw
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _base_sig(base_pattern_id):
+        # Zero-noise signature depends only on pattern_id, so it is built once
+        raw = TestAIEngine._raw_sig(base_pattern_id)
+        base_sig = raw / np.linalg.norm(raw)
+        base_sig.setflags(write=False)
+        return base_sig
+
     def _generate_synthetic_signature(self, base_pattern_id, noise_level=0.0):
-        # Deterministic generation based on pattern_id
-        np.random.seed(base_pattern_id)
-        
-        # Create a "base" signature for this goat
-        base_sig = np.random.rand(144).astype(np.float32)
-        
         # Add noise if simulating a new sighting of the same goat
         if noise_level > 0:
-            noise = np.random.normal(0, noise_level, 144).astype(np.float32)
-            varied_sig = base_sig + noise
-            # Normalize like in real code
-            cv2.normalize(varied_sig, varied_sig)
-            return varied_sig.flatten().tolist()
-            
-        cv2.normalize(base_sig, base_sig)
-        return base_sig.flatten().tolist()
+            noise_rng = np.random.default_rng((base_pattern_id, int(noise_level * 1000)))
+            noise = noise_rng.standard_normal(144, dtype=np.float32) * np.float32(noise_level)
+            varied_sig = self._raw_sig(base_pattern_id) + noise
+            # L2-normalize like in real code (cv2.normalize's default NORM_L2)
+            varied_sig /= np.linalg.norm(varied_sig)
+            return varied_sig.tolist()
+
+        return self._base_sig(base_pattern_id).tolist()
 
     # We test the _find_matching_goat logic specifically
     def test_reid_logic(self):
-        db = DatabaseManager(self.db_path)
+        db = self.db
         logger.info("--- Starting Re-ID Accuracy Test ---")
 
         # Scenario 1: First Sighting of Goat A (Pattern ID: 1001)
@@ -65,15 +76,16 @@ class TestAIEngine(AIEngine):
         
         if not matched_id:
             logger.info("  -> Correctly identified as NEW goat.")
-            # Register it
-            goat_id_a = db.execute_update(
-                "INSERT INTO goats (ear_tag, breed, status) VALUES (?, ?, ?)",
-                ("GOAT-A", "Boer", "Active")
-            )
-            db.execute_update(
-                "INSERT INTO goat_visual_signatures (goat_id, color_signature) VALUES (?, ?)",
-                (goat_id_a, json.dumps(sig_a_1))
-            )
+            # Register it (goat + signature commit together)
+            with db.transaction():
+                goat_id_a = db.execute_update(
+                    "INSERT INTO goats (ear_tag, breed, status) VALUES (?, ?, ?)",
+                    ("GOAT-A", "Boer", "Active")
+                )
+                db.execute_update(
+                    "INSERT INTO goat_visual_signatures (goat_id, color_signature) VALUES (?, ?)",
+                    (goat_id_a, np.asarray(sig_a_1, dtype=np.float32).tobytes())
+                )
             logger.info(f"  -> Registered Goat A with ID: {goat_id_a}")
         else:
             logger.error(f"  -> FAILED: Matched unknown goat to ID {matched_id}")
@@ -97,15 +109,16 @@ class TestAIEngine(AIEngine):
         
         if not matched_id:
             logger.info("  -> Correctly identified as NEW goat.")
-            # Register it
-            goat_id_b = db.execute_update(
-                "INSERT INTO goats (ear_tag, breed, status) VALUES (?, ?, ?)",
-                ("GOAT-B", "Saanen", "Active")
-            )
-            db.execute_update(
-                "INSERT INTO goat_visual_signatures (goat_id, color_signature) VALUES (?, ?)",
-                (goat_id_b, json.dumps(sig_b_1))
-            )
+            # Register it (goat + signature commit together)
+            with db.transaction():
+                goat_id_b = db.execute_update(
+                    "INSERT INTO goats (ear_tag, breed, status) VALUES (?, ?, ?)",
+                    ("GOAT-B", "Saanen", "Active")
+                )
+                db.execute_update(
+                    "INSERT INTO goat_visual_signatures (goat_id, color_signature) VALUES (?, ?)",
+                    (goat_id_b, np.asarray(sig_b_1, dtype=np.float32).tobytes())
+                )
             logger.info(f"  -> Registered Goat B with ID: {goat_id_b}")
         elif matched_id == goat_id_a:
             logger.error("  -> FAILED: False Positive! Mistook Goat B for Goat A.")
@@ -126,11 +139,13 @@ class TestAIEngine(AIEngine):
         logger.info("--- Test Complete ---")
 
 if __name__ == "__main__":
-    engine = TestAIEngine(TEST_DB)
+    engine = TestAIEngine(TEST_DB, db_manager)
     engine.test_reid_logic()
+    db_manager.close()
     
-    # Cleanup
-    if os.path.exists(TEST_DB):
-        try:
-            os.remove(TEST_DB)
-        except: pass
+    # Cleanup (including WAL side files)
+    for path in (TEST_DB, TEST_DB + "-wal", TEST_DB + "-shm"):
+        if os.path.exists(path):
+            try:
+                os.remove(path)
+            except: pass
@@ -1,17 +1,46 @@
 
 import os
-from ultralytics import YOLO
+import sys
+
+# Stable cache location so the checkpoint (and ultralytics settings) survive
+# between runs; must be set before ultralytics is imported.
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "goatai")
+os.makedirs(CACHE_DIR, exist_ok=True)
+os.environ.setdefault("YOLO_CONFIG_DIR", CACHE_DIR)
+
+WEIGHTS = os.path.join(CACHE_DIR, "yolov8s.pt")
+TORCH_ZIP_MAGIC = b"PK\x03\x04"  # torch.save checkpoints are zip archives
+
+def checkpoint_header_ok(path):
+    """Cheap integrity check: the file exists and starts with the zip magic"""
+    if not os.path.exists(path):
+        return False
+    with open(path, "rb") as f:
+        return f.read(4) == TORCH_ZIP_MAGIC
 
 def test():
     # Attempt to load a DIFFERENT model to see if it's a specific file corruption
     print("Attempting to load YOLOv8s...")
     try:
-        # If yolov8s.pt exists locally, delete it to force clean download
-        if os.path.exists("yolov8s.pt"):
-            os.remove("yolov8s.pt")
+        # Only discard the cached checkpoint when a clean download is requested
+        if os.environ.get("FORCE_REDOWNLOAD") and os.path.exists(WEIGHTS):
+            os.remove(WEIGHTS)
         
-        model = YOLO("yolov8s.pt")
-        print("✅ Successfully loaded yolov8s.pt")
+        # Fast path: a cached checkpoint with a valid header is enough unless a
+        # full deserialization is requested with --deep
+        header_ok = checkpoint_header_ok(WEIGHTS)
+        if "--deep" not in sys.argv[1:] and header_ok:
+            print(f"✅ Checkpoint header valid: {WEIGHTS} (run with --deep for a full load)")
+            return
+
+        # A malformed cached checkpoint is removed so YOLO() below downloads a fresh copy
+        if not header_ok and os.path.exists(WEIGHTS):
+            print(f"⚠️ Malformed checkpoint header, re-downloading: {WEIGHTS}")
+            os.remove(WEIGHTS)
+
+        from ultralytics import YOLO  # only the full load pays for the import
+        model = YOLO(WEIGHTS)
+        print(f"✅ Successfully loaded {WEIGHTS}")
     except Exception as e:
         print(f"❌ Failed to load yolov8s.pt: {e}")
 